@@ -13,8 +13,15 @@ import os
 import yaml
 import re
 from datetime import datetime
-from utils.keyword_matcher import extract_keywords_from_text, calculate_match_score, normalize_keyword
+from utils.keyword_matcher import (
+    extract_keywords_from_text, calculate_keyword_coverage, score_keyword_location,
+    normalize_keyword, KeywordLocation, MAX_NGRAM
+)
 from utils.markdown_parser import load_all_experiences
+from utils.experience_index import ExperienceIndex
+from utils.job_corpus import DocumentFrequencyStore
+from utils.fuzzy_index import build_fuzzy_index
+from utils.tokenizer import token_set
 
 
 def parse_job_description(file_path):
@@ -44,13 +51,22 @@ def parse_job_description(file_path):
     return job_data
 
 
-def extract_required_vs_preferred(text):
+def extract_required_vs_preferred(text, keyword_stats=None):
     """
     Identify required vs. preferred qualifications from job description.
 
+    Keywords (including phrases of up to MAX_NGRAM words) are ranked by
+    BM25 weight against the job corpus when a DocumentFrequencyStore is
+    given, otherwise by raw frequency.
+
     Returns:
         Tuple of (required_keywords, preferred_keywords)
     """
+    def rank_keywords(section_text, min_frequency):
+        if keyword_stats is None:
+            return extract_keywords_from_text(section_text, min_frequency=min_frequency, max_ngram=MAX_NGRAM)
+        return keyword_stats.rank_keywords(section_text, min_frequency=min_frequency)
+
     required_keywords = []
     preferred_keywords = []
 
@@ -89,14 +105,14 @@ def extract_required_vs_preferred(text):
 
     # Extract keywords from each section
     if required_text:
-        required_keywords = [kw for kw, _ in extract_keywords_from_text(required_text, min_frequency=1)[:20]]
+        required_keywords = [kw for kw, _ in rank_keywords(required_text, 1)[:20]]
 
     if preferred_text:
-        preferred_keywords = [kw for kw, _ in extract_keywords_from_text(preferred_text, min_frequency=1)[:15]]
+        preferred_keywords = [kw for kw, _ in rank_keywords(preferred_text, 1)[:15]]
 
-    # If no clear sections, use frequency analysis on full text
+    # If no clear sections, rank keywords across the full text
     if not required_keywords:
-        all_keywords = extract_keywords_from_text(text, min_frequency=2)
+        all_keywords = rank_keywords(text, 2)
         # Top 15 are "required", next 10 are "preferred"
         required_keywords = [kw for kw, _ in all_keywords[:15]]
         preferred_keywords = [kw for kw, _ in all_keywords[15:25]]
@@ -104,10 +120,29 @@ def extract_required_vs_preferred(text):
     return required_keywords, preferred_keywords
 
 
+# Common technical indicators
+TECH_TERMS = frozenset({
+    'python', 'java', 'javascript', 'ruby', 'go', 'rust', 'c++', 'typescript', 'sql', 'html', 'css',
+    'aws', 'gcp', 'azure', 'docker', 'kubernetes', 'jenkins', 'git',
+    'react', 'angular', 'vue', 'django', 'flask', 'spring', 'rails',
+    'api', 'rest', 'graphql', 'microservices', 'database', 'frontend', 'backend'
+})
+
+# Common soft skill indicators
+SOFT_SKILL_TERMS = frozenset({
+    'leadership', 'communication', 'collaboration', 'teamwork', 'mentoring',
+    'problem-solving', 'analytical', 'creative', 'organized', 'detail-oriented',
+    'agile', 'scrum', 'management', 'planning', 'strategy'
+})
+
+
 def categorize_keywords(keywords, text):
     """
     Categorize keywords into technical, soft skills, etc.
 
+    A keyword is matched against the indicator terms by its tokens (and
+    the parts of compound tokens like "problem-solving").
+
     Returns:
         Dictionary with categorized keywords
     """
@@ -115,31 +150,14 @@ def categorize_keywords(keywords, text):
     soft_keywords = []
     industry_keywords = []
 
-    # Common technical indicators
-    tech_patterns = [
-        r'\b(python|java|javascript|ruby|go|rust|c\+\+|typescript|sql|html|css)\b',
-        r'\b(aws|gcp|azure|docker|kubernetes|jenkins|git)\b',
-        r'\b(react|angular|vue|django|flask|spring|rails)\b',
-        r'\b(api|rest|graphql|microservices|database|frontend|backend)\b'
-    ]
-
-    # Common soft skill indicators
-    soft_patterns = [
-        r'\b(leadership|communication|collaboration|teamwork|mentoring)\b',
-        r'\b(problem-solving|analytical|creative|organized|detail-oriented)\b',
-        r'\b(agile|scrum|management|planning|strategy)\b'
-    ]
-
-    text_lower = text.lower()
-
     for keyword in keywords:
-        keyword_lower = keyword.lower()
+        words = token_set(keyword)
 
         # Check if technical
-        if any(re.search(pattern, keyword_lower, re.IGNORECASE) for pattern in tech_patterns):
+        if not words.isdisjoint(TECH_TERMS):
             tech_keywords.append(keyword)
         # Check if soft skill
-        elif any(re.search(pattern, keyword_lower, re.IGNORECASE) for pattern in soft_patterns):
+        elif not words.isdisjoint(SOFT_SKILL_TERMS):
             soft_keywords.append(keyword)
         else:
             industry_keywords.append(keyword)
@@ -165,37 +183,51 @@ def analyze_match_against_resume(keywords, base_resume_path, experiences_dir):
     # Load experiences
     experiences = load_all_experiences(experiences_dir)
 
-    # Build resume text
-    resume_parts = []
+    # Build located resume segments
+    segments = []
 
     # Add basics
     basics = base_resume.get('basics', {})
     if basics.get('summary'):
-        resume_parts.append(basics['summary'])
+        segments.append((KeywordLocation('summary'), basics['summary']))
 
     # Add experience content
-    for exp in experiences:
-        resume_parts.append(exp.get('company', ''))
-        resume_parts.append(exp.get('position', ''))
-        resume_parts.append(exp.get('content', ''))
+    exp_locations = []
+    for position, exp in enumerate(experiences):
+        location = KeywordLocation('experience', exp.get('slug') or str(position))
+        exp_text = '\n'.join([exp.get('company', ''), exp.get('position', ''), exp.get('content', '')])
+        segments.append((location, exp_text))
+        exp_locations.append(location)
 
     # Add skills
     for skill_cat in base_resume.get('skills', []):
-        resume_parts.extend(skill_cat.get('keywords', []))
+        location = KeywordLocation('skills', skill_cat.get('category', ''))
+        segments.append((location, '\n'.join(skill_cat.get('keywords', []))))
 
-    resume_text = '\n'.join(resume_parts)
+    resume_text = '\n'.join(text for _, text in segments)
 
-    # Calculate match
+    # Calculate match, recording which experience carries each keyword
     required = keywords.get('required', [])
     preferred = keywords.get('preferred', [])
 
-    match_result = calculate_match_score(resume_text, required, preferred)
+    coverage = calculate_keyword_coverage(segments, required, preferred)
+
+    # The location maps stay out of the analysis, which is written to YAML
+    match_result = dict(coverage)
+    del match_result['keyword_locations'], match_result['location_counts']
 
-    # Add experience-level matching
+    # Near-misses: missing keywords that are a typo or variant of a resume term
+    tags = [kw for exp in experiences for kw in exp.get('keywords', [])]
+    fuzzy_index = build_fuzzy_index([resume_text], phrases=tags)
+    missing = match_result['required_missing'] + match_result['preferred_missing']
+    match_result['fuzzy_matches'] = {
+        kw: term for kw, (term, _) in fuzzy_index.resolve_keywords(missing).items()
+    }
+
+    # Add experience-level matching from the same coverage map
     exp_matches = []
-    for exp in experiences:
-        exp_text = f"{exp.get('company', '')} {exp.get('position', '')} {exp.get('content', '')}"
-        exp_score = calculate_match_score(exp_text, required, preferred)
+    for location, exp in zip(exp_locations, experiences):
+        exp_score = score_keyword_location(coverage, location, required, preferred)
 
         exp_matches.append({
             'slug': exp.get('slug'),
@@ -211,6 +243,11 @@ def analyze_match_against_resume(keywords, base_resume_path, experiences_dir):
     return match_result
 
 
+# Missing keywords to suggest placements for, and ranked bullets shown for each
+PLACEMENT_KEYWORDS = 3
+PLACEMENTS_PER_KEYWORD = 3
+
+
 def generate_tailoring_recommendations(match_analysis, experiences):
     """
     Generate intelligent recommendations for resume tailoring.
@@ -245,6 +282,17 @@ def generate_tailoring_recommendations(match_analysis, experiences):
             f"Consider emphasizing: {', '.join(missing[:3])}"
         )
 
+        index = ExperienceIndex(experiences)
+        for keyword in missing[:PLACEMENT_KEYWORDS]:
+            placements = index.rank_placements(keyword, top_k=PLACEMENTS_PER_KEYWORD)
+            if placements:
+                lines = [f"'{keyword}' could go in:"]
+                lines.extend(
+                    f"    {rank}. {placement['company']}: {placement['reason']}"
+                    for rank, placement in enumerate(placements, 1)
+                )
+                recommendations['notes'].append('\n'.join(lines))
+
     # Overall match assessment
     overall_score = match_analysis.get('overall_score', 0)
     if overall_score >= 80:
@@ -309,6 +357,10 @@ def main():
     parser.add_argument('--base-resume', required=True, help='Base resume YAML file')
     parser.add_argument('--experiences-dir', default='data/experiences', help='Experiences directory')
     parser.add_argument('--output-dir', required=True, help='Output directory for job files')
+    parser.add_argument('--jobs-dir', default='jobs', help='Jobs directory (one subdirectory per posting) '
+                                                         'used as the keyword-ranking corpus')
+    parser.add_argument('--keyword-stats', help='Document-frequency store for keyword ranking '
+                                                '(default: .keyword-stats.json in the jobs directory)')
 
     args = parser.parse_args()
 
@@ -318,8 +370,26 @@ def main():
     print(f"Analyzing job description: {args.job_description}")
     job_data = parse_job_description(args.job_description)
 
+    # Record this posting, keyed by its job directory, in the corpus
+    # statistics (built from the whole jobs directory only the first time)
+    doc_id = os.path.basename(os.path.dirname(os.path.abspath(args.job_description)))
+    jobs_dir = args.jobs_dir
+    if args.keyword_stats or os.path.isdir(jobs_dir):
+        stats_path = args.keyword_stats or os.path.join(jobs_dir, '.keyword-stats.json')
+        keyword_stats = DocumentFrequencyStore.load(stats_path, max_ngram=MAX_NGRAM)
+        changed = 0
+        if keyword_stats.document_count == 0 and os.path.isdir(jobs_dir):
+            changed += keyword_stats.add_corpus(jobs_dir)
+        changed += keyword_stats.add_document(doc_id, job_data['text'])
+        if changed:
+            keyword_stats.save()
+    else:
+        print(f"Warning: Jobs directory {jobs_dir} not found; ranking keywords without corpus statistics")
+        keyword_stats = DocumentFrequencyStore(max_ngram=MAX_NGRAM)
+        keyword_stats.add_document(doc_id, job_data['text'])
+
     print("Extracting keywords and requirements...")
-    required_kw, preferred_kw = extract_required_vs_preferred(job_data['text'])
+    required_kw, preferred_kw = extract_required_vs_preferred(job_data['text'], keyword_stats)
 
     print(f"Found {len(required_kw)} required and {len(preferred_kw)} preferred keywords")
 
@@ -345,6 +415,9 @@ def main():
     print(f"  - Required keywords: {match_analysis['required_score']}%")
     print(f"  - Preferred keywords: {match_analysis['preferred_score']}%")
 
+    for keyword, term in match_analysis['fuzzy_matches'].items():
+        print(f"  ~ '{keyword}' not found, but resume has close match '{term}'")
+
     print("\nGenerating tailoring recommendations...")
     recommendations = generate_tailoring_recommendations(match_analysis, experiences)
 
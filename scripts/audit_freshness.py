@@ -20,7 +20,7 @@ from typing import Dict, List
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.markdown_parser import parse_experience_file
+from utils.markdown_parser import load_experience_cache, parse_experience_file
 from utils.freshness_checker import (
     get_file_git_history,
     validate_threshold
@@ -146,6 +146,7 @@ def main():
 
     results = []
     skipped = []
+    cache = load_experience_cache(str(exp_dir))
 
     for exp_file in sorted(exp_dir.glob('*.md')):
         # Skip template and hidden files
@@ -153,7 +154,7 @@ def main():
             continue
 
         try:
-            experience = parse_experience_file(str(exp_file))
+            experience = parse_experience_file(str(exp_file), cache)
 
             # Validate required fields
             if not experience.get('endDate'):
@@ -184,6 +185,8 @@ def main():
         except Exception as e:
             skipped.append(f"{exp_file.name}: {str(e)}")
 
+    cache.save()
+
     # Exit if no valid experiences found
     if not results:
         print("\n⚠️  No valid experience files found.")
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the parsing and scoring utilities.
+
+Usage:
+    python benchmark.py bullets --bullets 10000
+    python benchmark.py memory --bullets 100000
+    python benchmark.py solver --bullets 500
+"""
+
+import argparse
+import gc
+import random
+import re
+import time
+import tracemalloc
+
+from utils.keyword_matcher import calculate_keyword_coverage, iter_content_segments
+from utils.keyword_vocabulary import keyword_mask
+from utils.length_optimizer import estimate_content_length, select_bullets_within_budget
+from utils.markdown_parser import parse_bullets_from_markdown
+from utils.models import Experience
+
+
+# The regex bullet parser that the line scanner replaced, kept for comparison
+LEGACY_BULLET_PATTERN = re.compile(
+    r'###\s+\d+\.\s+(.+?)(?:\[(.+?)\])?\n((?:.*\n)*?)(?=#{2,3}\s|\Z)',
+    re.MULTILINE
+)
+
+
+def legacy_parse_bullets(content):
+    """Regex bullet parser as it was before the line scanner."""
+    bullets = []
+
+    for i, match in enumerate(LEGACY_BULLET_PATTERN.finditer(content.rstrip('\n') + '\n'), 1):
+        title = match.group(1).strip()
+        metadata_str = match.group(2) if match.group(2) else ''
+        description = match.group(3).strip()
+
+        priority = i
+        keywords = []
+
+        if metadata_str:
+            priority_match = re.search(r'priority:(\d+)', metadata_str)
+            if priority_match:
+                priority = int(priority_match.group(1))
+
+            keywords_match = re.search(r'keywords:([^,\]]+(?:,[^,\]]+)*)', metadata_str)
+            if keywords_match:
+                keywords = [k.strip() for k in keywords_match.group(1).split(',')]
+
+        full_text = f"{title}. {description}" if description else title
+
+        bullets.append({
+            'title': title,
+            'description': description,
+            'text': full_text,
+            'priority': priority,
+            'keywords': keywords,
+            'keyword_mask': keyword_mask(keywords)
+        })
+
+    return bullets
+
+
+def generate_experience_markdown(bullet_count, seed=0):
+    """Synthetic experience body with bullet_count well-formed bullets."""
+    rng = random.Random(seed)
+    words = ['platform', 'security', 'pipeline', 'latency', 'migrated', 'reduced',
+             'Kubernetes', 'Terraform', 'AWS', 'compliance', 'automation', 'teams']
+    tags = ['Python', 'AWS', 'Terraform', 'Kubernetes', 'Go', 'SOC 2', 'CI/CD']
+
+    lines = ['## Summary', 'Led infrastructure and security engineering.', '', '## Achievements', '']
+    for i in range(1, bullet_count + 1):
+        keywords = ','.join(rng.sample(tags, 3))
+        lines.append(f"### {i}. {' '.join(rng.choices(words, k=5)).capitalize()} "
+                     f"[priority:{rng.randint(1, 5)}, keywords:{keywords}]")
+        for _ in range(rng.randint(1, 3)):
+            lines.append(' '.join(rng.choices(words, k=rng.randint(8, 20))) + '.')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_malformed_markdown(length):
+    """Bullet header with a long run of unclosed metadata brackets."""
+    return '### 1. Title ' + '[x' * (length // 2) + '\nDescription.\n'
+
+
+def best_time(func, *args, repeat=3):
+    """Best wall-clock time of several calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare_bullet_parsers(label, content):
+    """Time both bullet parsers on content and check they agree."""
+    legacy_time = best_time(legacy_parse_bullets, content)
+    scanner_time = best_time(parse_bullets_from_markdown, content, {})
+
+    expected = legacy_parse_bullets(content)
+    actual = parse_bullets_from_markdown(content, {})
+
+    print(f"\n{label} ({len(content):,} chars, {len(actual):,} bullets)")
+    print(f"  regex:        {legacy_time * 1000:9.1f} ms")
+    print(f"  line scanner: {scanner_time * 1000:9.1f} ms")
+    print(f"  speedup:      {legacy_time / max(scanner_time, 1e-9):9.1f}x")
+    print(f"  identical output: {'yes' if expected == actual else 'NO'}")
+
+
+def benchmark_bullets(args):
+    compare_bullet_parsers(
+        f"Well-formed file, {args.bullets:,} bullets",
+        generate_experience_markdown(args.bullets)
+    )
+    compare_bullet_parsers(
+        f"Malformed header, {args.malformed_length:,} unclosed brackets",
+        generate_malformed_markdown(args.malformed_length)
+    )
+
+
+def iter_parsed_experiences(bullet_count, bullets_per_experience=10, seed=0):
+    """
+    Synthetic parsed experiences as dicts, shaped like the markdown parser's output.
+
+    Every string is built fresh, as it would be when parsing separate files.
+    """
+    rng = random.Random(seed)
+    words = ['platform', 'security', 'pipeline', 'latency', 'migrated', 'reduced',
+             'Kubernetes', 'Terraform', 'AWS', 'compliance', 'automation', 'teams']
+    tags = 'Python,AWS,Terraform,Kubernetes,Go,SOC 2,CI/CD,IAM,Lambda,Docker'
+
+    for exp_index in range(0, bullet_count, bullets_per_experience):
+        bullets = []
+        for i in range(min(bullets_per_experience, bullet_count - exp_index)):
+            title = ' '.join(rng.choices(words, k=5)).capitalize()
+            description = ' '.join(rng.choices(words, k=rng.randint(15, 40))) + '.'
+            keywords = rng.sample(tags.split(','), 3)
+            bullets.append({
+                'title': title,
+                'description': description,
+                'text': f"{title}. {description}",
+                'priority': i + 1,
+                'keywords': keywords,
+                'keyword_mask': keyword_mask(keywords)
+            })
+
+        keywords = rng.sample(tags.split(','), 5)
+        yield {
+            'company': f"Company {exp_index}",
+            'position': 'Senior Engineer',
+            'location': 'Remote',
+            'startDate': '2020-01-01',
+            'endDate': 'present',
+            'keywords': keywords,
+            'relevant_for': ['senior-engineer', 'tech-lead'],
+            'priority': 1,
+            'versions': {'detailed': 5, 'standard': 3, 'concise': 2},
+            'content': '\n\n'.join(bullet['text'] for bullet in bullets),
+            'slug': f"company-{exp_index}",
+            'keyword_mask': keyword_mask(keywords),
+            'bullets': bullets
+        }
+
+
+def measure_memory(build):
+    """Bytes still allocated after build() returns, and the result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def benchmark_memory(args):
+    dict_bytes, dicts = measure_memory(lambda: list(iter_parsed_experiences(args.bullets)))
+    del dicts
+    record_bytes, records = measure_memory(
+        lambda: [Experience.from_dict(data) for data in iter_parsed_experiences(args.bullets)]
+    )
+
+    print(f"\nSynthetic corpus: {len(records):,} experiences, {args.bullets:,} bullets")
+    print(f"  dicts:   {dict_bytes / 2**20:8.1f} MiB")
+    print(f"  records: {record_bytes / 2**20:8.1f} MiB")
+    print(f"  saved:   {(1 - record_bytes / dict_bytes) * 100:8.1f}%")
+
+
+def benchmark_solver(args):
+    experiences = list(iter_parsed_experiences(args.bullets, args.bullets_per_experience))
+    for exp in experiences:
+        exp['bullets'] = [dict(bullet) for bullet in exp['bullets']]
+    content = {'summary': 'Security-minded infrastructure leader.', 'experiences': experiences}
+    required = ['Python', 'AWS', 'Terraform', 'Kubernetes', 'SOC 2', 'IAM', 'compliance']
+    preferred = ['Go', 'Docker', 'Lambda', 'automation']
+    coverage = calculate_keyword_coverage(iter_content_segments(content), required, preferred)
+
+    def solve():
+        fresh = dict(content, experiences=[
+            dict(exp, bullets=list(exp['bullets'])) for exp in content['experiences']
+        ])
+        return select_bullets_within_budget(fresh, args.pages, required, coverage, preferred)
+
+    solve_time = best_time(solve)
+    optimized, _ = solve()
+    kept = sum(len(exp['bullets']) for exp in optimized['experiences'])
+
+    print(f"\nBudgeted selection: {args.bullets:,} candidate bullets, "
+          f"{estimate_content_length(content):.1f} -> {args.pages:g} pages")
+    print(f"  solve time: {solve_time * 1000:9.1f} ms")
+    print(f"  kept:       {kept:9,} bullets (~{estimate_content_length(optimized):.2f} pages)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark resume parsing and scoring')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    bullets_parser = subparsers.add_parser('bullets', help='Regex vs line-scanner bullet parsing')
+    bullets_parser.add_argument('--bullets', type=int, default=10000, help='Bullets in the synthetic file')
+    bullets_parser.add_argument('--malformed-length', type=int, default=20000,
+                                help='Length of the malformed header line')
+    bullets_parser.set_defaults(func=benchmark_bullets)
+
+    memory_parser = subparsers.add_parser('memory', help='Dict vs slotted-record memory use')
+    memory_parser.add_argument('--bullets', type=int, default=100000, help='Bullets in the synthetic corpus')
+    memory_parser.set_defaults(func=benchmark_memory)
+
+    solver_parser = subparsers.add_parser('solver', help='Budgeted bullet selection')
+    solver_parser.add_argument('--bullets', type=int, default=500, help='Candidate bullets')
+    solver_parser.add_argument('--bullets-per-experience', type=int, default=100,
+                               help='Bullets in each synthetic experience')
+    solver_parser.add_argument('--pages', type=float, default=2.0, help='Page budget')
+    solver_parser.set_defaults(func=benchmark_solver)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
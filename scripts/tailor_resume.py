@@ -13,17 +13,18 @@ import argparse
 import os
 import yaml
 from datetime import datetime
+from docx.shared import Pt
 from utils.docx_handler import (
     create_ats_document, add_contact_header, add_section_header,
     add_experience_entry, add_skills_section, add_education_entry,
     add_project_entry, estimate_page_count, save_document
 )
-from utils.markdown_parser import (
-    load_all_experiences, parse_experience_file, format_date
-)
-from utils.keyword_matcher import calculate_match_score
+from utils.experience_library import ExperienceLibrary
+from utils.markdown_parser import format_date
+from utils.keyword_matcher import calculate_keyword_coverage, iter_content_segments
+from utils.skills_catalog import SkillsCatalog
 from utils.length_optimizer import (
-    reduce_to_target_length, prioritize_content,
+    JobScoringContext, reduce_to_target_length, select_bullets_within_budget, prioritize_content,
     select_experience_version, estimate_content_length
 )
 
@@ -40,10 +41,12 @@ def load_base_resume(base_path):
         return yaml.safe_load(f)
 
 
-def select_and_load_experiences(config, experiences_dir, all_experiences):
+def select_and_load_experiences(config, library):
     """
     Select and load experiences based on configuration.
 
+    Only the selected experiences are parsed from the library.
+
     Returns:
         List of experience dictionaries with selected content
     """
@@ -51,8 +54,9 @@ def select_and_load_experiences(config, experiences_dir, all_experiences):
     selected_exps = selection.get('experiences', [])
 
     if not selected_exps:
-        # No explicit selection - use top experiences by priority
-        return all_experiences[:4]
+        # No explicit selection - use top experiences by priority (as mutable
+        # dicts, since length optimization edits them)
+        return [exp.to_dict() for exp in library.top(4)]
 
     loaded_experiences = []
 
@@ -61,7 +65,7 @@ def select_and_load_experiences(config, experiences_dir, all_experiences):
         version = exp_config.get('version', 'standard')
 
         # Find the experience
-        exp = next((e for e in all_experiences if e.get('slug') == slug), None)
+        exp = library.get(slug)
 
         if not exp:
             print(f"Warning: Experience '{slug}' not found")
@@ -80,13 +84,14 @@ def select_and_load_experiences(config, experiences_dir, all_experiences):
 
         # Create experience entry
         exp_entry = {
+            'slug': slug,
             'company': exp.get('company'),
             'position': exp.get('position'),
             'location': exp.get('location'),
             'startDate': format_date(exp.get('startDate', '')),
             'endDate': format_date(exp.get('endDate', 'Present')),
-            'summary': exp.get('content', '').split('## Summary')[1].split('##')[0].strip() if '## Summary' in exp.get('content', '') else '',
-            'bullets': [b['text'] for b in selected_bullets],
+            'summary': exp.section('summary'),
+            'bullets': [dict(b) for b in selected_bullets],
             'selected_version': version
         }
 
@@ -115,30 +120,21 @@ def filter_and_prioritize_skills(base_resume, config, keywords):
     """
     Filter and prioritize skills based on job requirements.
 
+    Priority categories come first; the remaining categories, and the skills
+    within each category, are ordered by highlighted and job keyword matches.
+
     Returns:
         List of skill categories, prioritized and filtered
     """
-    all_skills = base_resume.get('skills', [])
+    catalog = SkillsCatalog(base_resume.get('skills', []))
     selection = config.get('selection', {}).get('skills', {})
 
-    priority_categories = selection.get('priority_categories', [])
-    highlight_keywords = selection.get('highlight_keywords', [])
-
-    # If no priority specified, return all skills
-    if not priority_categories:
-        return all_skills
-
-    # Reorder skills to put priority categories first
-    prioritized = []
-    remaining = []
-
-    for skill_cat in all_skills:
-        if skill_cat.get('category') in priority_categories:
-            prioritized.append(skill_cat)
-        else:
-            remaining.append(skill_cat)
-
-    return prioritized + remaining
+    return catalog.prioritize(
+        priority_categories=selection.get('priority_categories', []),
+        highlight_keywords=selection.get('highlight_keywords', []),
+        job_keywords=keywords.get('required', []) + keywords.get('preferred', []),
+        max_categories=selection.get('max_categories')
+    )
 
 
 def optimize_for_keywords(content, required_keywords, preferred_keywords):
@@ -148,33 +144,25 @@ def optimize_for_keywords(content, required_keywords, preferred_keywords):
     Returns:
         Tuple of (optimized_content, keyword_coverage_report)
     """
-    # Build resume text
-    resume_parts = []
-
-    if content.get('summary'):
-        resume_parts.append(content['summary'])
-
-    for exp in content.get('experiences', []):
-        resume_parts.append(exp.get('company', ''))
-        resume_parts.append(exp.get('position', ''))
-        for bullet in exp.get('bullets', []):
-            resume_parts.append(bullet)
-
-    for skill_cat in content.get('skills', []):
-        resume_parts.extend(skill_cat.get('keywords', []))
-
-    resume_text = '\n'.join(resume_parts)
-
-    # Calculate match
-    match_result = calculate_match_score(resume_text, required_keywords, preferred_keywords)
+    # Match once over summary, experience headers, bullets and skills,
+    # recording where each keyword occurs
+    match_result = calculate_keyword_coverage(
+        iter_content_segments(content), required_keywords, preferred_keywords
+    )
 
     return content, match_result
 
 
-def apply_length_optimization(content, config, keywords):
+def apply_length_optimization(content, config, keywords, coverage=None, context=None):
     """
     Apply length optimization to fit target page count.
 
+    The keyword coverage map, if given, keeps the only bullet carrying a
+    required keyword from being dropped. With ``optimization.reduction_mode``
+    set to "solver", bullets are chosen by budgeted keyword coverage instead
+    of the fixed reduction strategies. The scoring context, if given, is
+    reused for every bullet and experience score.
+
     Returns:
         Tuple of (optimized_content, list_of_changes)
     """
@@ -193,8 +181,15 @@ def apply_length_optimization(content, config, keywords):
         print("✓ Content within target length")
         return content, []
 
+    if optimization.get('reduction_mode', 'strategies') == 'solver':
+        print("Applying length optimization (budgeted bullet selection)...")
+        preferred_keywords = config.get('keywords', {}).get('preferred', [])
+        return select_bullets_within_budget(
+            content, max_pages, required_keywords, coverage, preferred_keywords, context
+        )
+
     print("Applying length optimization...")
-    optimized, changes = reduce_to_target_length(content, max_pages, required_keywords)
+    optimized, changes = reduce_to_target_length(content, max_pages, required_keywords, coverage, context)
 
     return optimized, changes
 
@@ -213,7 +208,7 @@ def generate_resume_docx(content, output_path):
     if content.get('summary'):
         add_section_header(doc, 'Professional Summary')
         summary_para = doc.add_paragraph(content['summary'])
-        summary_para.runs[0].font.size = 10
+        summary_para.runs[0].font.size = Pt(10)
         doc.add_paragraph()
 
     # Add experience section
@@ -265,9 +260,24 @@ def generate_report(match_result, length_changes, final_pages, config):
     print(f"  - Required keywords: {match_result['required_score']}%")
     print(f"  - Preferred keywords: {match_result['preferred_score']}%")
 
+    keyword_locations = match_result.get('keyword_locations', {})
+
     print(f"\nMatched Keywords ({len(match_result['required_matched'])}):")
     for kw in match_result['required_matched'][:10]:
-        print(f"  ✓ {kw}")
+        locations = keyword_locations.get(kw, [])
+        if locations:
+            where = ', '.join(str(loc) for loc in locations[:3])
+            if len(locations) > 3:
+                where += f" (+{len(locations) - 3} more)"
+            print(f"  ✓ {kw} — {where}")
+        else:
+            print(f"  ✓ {kw}")
+
+    single = [kw for kw in match_result['required_matched'] if len(keyword_locations.get(kw, [])) == 1]
+    if single:
+        print(f"\nKeywords Carried by a Single Location ({len(single)}):")
+        for kw in single[:5]:
+            print(f"  ! {kw} — only in {keyword_locations[kw][0]}")
 
     if match_result['required_missing']:
         print(f"\nMissing Keywords ({len(match_result['required_missing'])}):")
@@ -304,11 +314,12 @@ def main():
     config = load_config(args.job_config)
     base_resume = load_base_resume(args.base_resume)
 
-    print("Loading experiences...")
-    all_experiences = load_all_experiences(args.experiences_dir)
+    print("Indexing experiences...")
+    library = ExperienceLibrary(args.experiences_dir)
 
     print("Selecting content based on configuration...")
-    selected_experiences = select_and_load_experiences(config, args.experiences_dir, all_experiences)
+    selected_experiences = select_and_load_experiences(config, library)
+    library.save()
 
     print(f"Selected {len(selected_experiences)} experiences")
 
@@ -333,7 +344,10 @@ def main():
 
     # Phase 2: Length Optimization
     print("\nPhase 2: Optimizing length...")
-    content, length_changes = apply_length_optimization(content, config, keywords)
+    scoring_context = JobScoringContext(keywords.get('required', []))
+    content, length_changes = apply_length_optimization(
+        content, config, keywords, match_result, scoring_context
+    )
 
     # Phase 3: Generate DOCX
     print("\nPhase 3: Generating DOCX resume...")
@@ -0,0 +1,6 @@
+"""Make the scripts' ``utils`` package importable, as when running a script from scripts/."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
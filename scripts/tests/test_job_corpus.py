@@ -0,0 +1,50 @@
+"""Tests for the persisted document-frequency store."""
+
+import os
+import tempfile
+import unittest
+
+from utils.job_corpus import DocumentFrequencyStore
+
+
+POSTINGS = {
+    'alpha': "Build deployment pipelines.\nOwn deployment pipelines and incident response.\nShip the new billing service.",
+    'beta': "Automate deployment pipelines with Terraform.\nLead incident response drills.",
+}
+
+
+class DocumentFrequencyStoreTest(unittest.TestCase):
+
+    def test_one_off_phrases_are_not_stored(self):
+        store = DocumentFrequencyStore(max_ngram=4)
+        store.add_document('alpha', POSTINGS['alpha'])
+
+        self.assertEqual(store.document_frequency['deployment pipelines'], 1)  # repeated
+        self.assertEqual(store.document_frequency['incident response'], 1)  # dictionary term
+        self.assertNotIn('billing service', store.document_frequency)  # said once
+        self.assertEqual(store.document_frequency['billing'], 1)  # words always count
+
+    def test_updates_match_a_fresh_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'stats.json')
+            store = DocumentFrequencyStore.load(path, max_ngram=4)
+            store.add_document('alpha', "Old text about Kubernetes clusters.")
+            store.add_document('beta', POSTINGS['beta'])
+            store.save()
+
+            store = DocumentFrequencyStore.load(path, max_ngram=4)
+            self.assertFalse(store.add_document('beta', POSTINGS['beta']))
+            self.assertTrue(store.add_document('alpha', POSTINGS['alpha']))
+            store.save()
+
+            fresh = DocumentFrequencyStore(max_ngram=4)
+            for doc_id, text in POSTINGS.items():
+                fresh.add_document(doc_id, text)
+
+            store = DocumentFrequencyStore.load(path, max_ngram=4)
+            self.assertEqual(+store.document_frequency, +fresh.document_frequency)
+            self.assertEqual(store.total_length, fresh.total_length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for keyword variation matching."""
+
+import unittest
+
+from utils.keyword_matcher import KeywordMatcher, iter_keyword_contexts
+
+
+class DictionaryVariationTest(unittest.TestCase):
+    """Acronym and synonym forms must not match inside ordinary words."""
+
+    def test_common_words_do_not_match_dictionary_forms(self):
+        cases = {
+            'retrieval-augmented generation': ['storage', 'leverage', 'average'],  # RAG
+            'Shared Signals Framework': ['successfully'],  # SSF
+            'Azure Container Registry': ['acronym'],  # ACR
+            'Cloud Adoption Framework': ['cafe'],  # CAF
+            'HashiCorp Consul': ['consultant'],  # Consul
+            'HashiCorp Vault': ['vaulted'],  # Vault
+            'Apache Spark': ['sparked'],  # Spark
+            'AWS Lambda': ['lambda calculus'],  # Lambda
+        }
+        for keyword, words in cases.items():
+            matcher = KeywordMatcher([keyword])
+            for word in words:
+                with self.subTest(keyword=keyword, word=word):
+                    self.assertEqual(matcher.find_keywords(f"Improved {word} across teams"), set())
+                    self.assertEqual(matcher.count_keyword_hits(word), {})
+
+    def test_dictionary_forms_match_as_whole_words(self):
+        matcher = KeywordMatcher(['retrieval-augmented generation', 'Shared Signals Framework', 'HashiCorp Vault'])
+        self.assertEqual(
+            matcher.find_keywords('Built a RAG pipeline consuming SSF events with secrets in Vault.'),
+            {'retrieval-augmented generation', 'Shared Signals Framework', 'HashiCorp Vault'}
+        )
+
+    def test_related_technologies_are_not_synonyms(self):
+        cases = {
+            'vector database': 'Pinecone',
+            'Looker': 'Google Data Studio',
+            'Java': 'Jakarta EE',
+            'recurrent neural networks': 'LSTM',
+            'data engineer': 'data pipelines',
+        }
+        for keyword, related in cases.items():
+            with self.subTest(keyword=keyword):
+                self.assertEqual(KeywordMatcher([keyword]).find_keywords(f"Worked with {related}"), set())
+
+    def test_keyword_itself_still_matches_as_substring(self):
+        self.assertEqual(KeywordMatcher(['API']).find_keywords('Designed APIs'), {'API'})
+
+    def test_contexts_skip_dictionary_forms_inside_words(self):
+        contexts = list(iter_keyword_contexts('Cut storage costs; shipped RAG search', 'retrieval-augmented generation'))
+        self.assertEqual(len(contexts), 1)
+        self.assertIn('RAG', contexts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Tests for experience and bullet scoring."""
+
+import random
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from utils import length_optimizer
+from utils.keyword_vocabulary import VOCABULARY, keyword_mask
+from utils.length_optimizer import (
+    JobScoringContext, score_bullet, score_experience, select_bullets_within_budget
+)
+
+
+def reference_score_experience(exp, keywords, recency_weight=0.3):
+    """The original, uncached experience scorer."""
+    score = (6 - exp.get('priority', 5)) * 10
+    job_keywords_lower = [k.lower() for k in keywords]
+    score += sum(1 for k in exp.get('keywords', []) if k.lower() in job_keywords_lower) * 15
+
+    if exp.get('endDate', '').lower() == 'present':
+        score += 20 * recency_weight
+    elif exp.get('endDate'):
+        try:
+            years_ago = datetime.now().year - int(exp['endDate'][:4])
+        except ValueError:
+            years_ago = None
+        if years_ago is not None and years_ago <= 2:
+            score += 15 * recency_weight
+        elif years_ago is not None and years_ago <= 5:
+            score += 10 * recency_weight
+    return score
+
+
+def reference_score_bullet(bullet, keywords):
+    """The original, uncached bullet scorer."""
+    score = (6 - bullet.get('priority', 5)) * 10
+    job_keywords_lower = [k.lower() for k in keywords]
+    score += sum(1 for k in bullet.get('keywords', []) if k.lower() in job_keywords_lower) * 20
+    text_lower = bullet.get('text', '').lower()
+    score += sum(1 for k in job_keywords_lower if k in text_lower) * 5
+    if any(char.isdigit() for char in bullet.get('text', '')):
+        score += 10
+    return score
+
+
+POOL = ['Python', 'AWS', 'Go', 'Kubernetes', 'Terraform', 'incident response', 'SOC 2', 'React', 'ci/cd', 'Google']
+
+
+def random_item(rng, with_mask):
+    """An experience/bullet dict with distinct random keywords and text."""
+    keywords = rng.sample(POOL, rng.randint(0, 4))
+    keywords = [k.upper() if rng.random() < 0.3 else k for k in keywords]
+    words = rng.sample(POOL, rng.randint(0, 5)) + ['delivered', str(rng.randint(1, 99)) if rng.random() < 0.5 else 'work']
+    rng.shuffle(words)
+    item = {
+        'priority': rng.randint(1, 5),
+        'keywords': keywords,
+        'text': ' '.join(w.lower() if rng.random() < 0.5 else w for w in words),
+        'endDate': rng.choice(['present', 'Present', '', str(datetime.now().year - rng.randint(0, 9)) + '-06', 'soon']),
+    }
+    if with_mask:
+        item['keyword_mask'] = keyword_mask(keywords)
+    return item
+
+
+class JobScoringContextTest(unittest.TestCase):
+
+    def test_job_keywords_do_not_grow_the_vocabulary(self):
+        exp = {'priority': 2, 'keywords': ['Python', 'AWS'], 'keyword_mask': keyword_mask(['Python', 'AWS'])}
+        size = len(VOCABULARY)
+
+        for n in range(200):
+            context = JobScoringContext(['python', f'unlisted-skill-{n}'])
+            score_experience(exp, context)
+
+        self.assertEqual(len(VOCABULARY), size)
+
+    def test_mask_follows_keywords_interned_later(self):
+        context = JobScoringContext(['Python', 'interned-later'])
+        self.assertEqual(score_experience({'keywords': ['interned-later']}, context), 10 + 15)
+
+
+class ScoringRegressionTest(unittest.TestCase):
+    """Context-based, memoized scores must equal the original scorers."""
+
+    def test_scores_match_the_uncached_scorers(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            job = rng.sample(POOL, rng.randint(1, 6)) + rng.sample(POOL, rng.randint(0, 2))
+            context = JobScoringContext(job)
+            for _ in range(20):
+                item = random_item(rng, with_mask=rng.random() < 0.5)
+                with self.subTest(job=job, item=item):
+                    expected = reference_score_bullet(item, job)
+                    self.assertEqual(score_bullet(item, context), expected)
+                    self.assertEqual(score_bullet(item, job), expected)
+                    self.assertAlmostEqual(score_experience(item, context), reference_score_experience(item, job))
+                    self.assertAlmostEqual(score_experience(item, job), reference_score_experience(item, job))
+
+    def test_bullet_memo_evicts_least_recently_used(self):
+        context = JobScoringContext(['Python'])
+        bullets = [{'text': f"Bullet {n}", 'keywords': []} for n in range(4)]
+        with mock.patch.object(length_optimizer, 'BULLET_SCORE_CACHE_SIZE', 3), \
+                mock.patch.object(length_optimizer, '_bullet_scores', length_optimizer.OrderedDict()) as memo:
+            for bullet in bullets[:3]:
+                score_bullet(bullet, context)
+            score_bullet(bullets[0], context)  # refresh the oldest entry
+            score_bullet(bullets[3], context)
+
+            self.assertEqual(len(memo), 3)
+            self.assertEqual([key[1] for key in memo], ["Bullet 2", "Bullet 0", "Bullet 3"])
+
+
+def budget_content(summary_words, bullets_per_experience):
+    """Two experiences of short bullets under a summary of the given length."""
+    return {
+        'summary': ' '.join(['delivered'] * summary_words),
+        'experiences': [
+            {
+                'slug': f"exp-{n}",
+                'position': 'Engineer',
+                'company': f"Company {n}",
+                'bullets': [{'text': f"Shipped Python service {b} for team {n}"} for b in range(bullets_per_experience)],
+            }
+            for n in range(2)
+        ],
+    }
+
+
+class BulletBudgetTest(unittest.TestCase):
+
+    def test_non_bullet_overflow_is_reported_as_such(self):
+        _, changes = select_bullets_within_budget(budget_content(3000, 4), 1.0, ['Python'])
+
+        self.assertTrue(any(change.startswith("Content outside bullets") for change in changes))
+        self.assertFalse(any(change.startswith("Minimum of") for change in changes))
+
+    def test_minimum_bullets_overflow_is_reported_as_such(self):
+        content = budget_content(0, 4)
+        for exp in content['experiences']:
+            exp['bullets'] = [{'text': ' '.join(['delivered'] * 250)} for _ in range(4)]
+        _, changes = select_bullets_within_budget(content, 1.0, ['Python'])
+
+        self.assertTrue(any(change.startswith("Minimum of") for change in changes))
+        self.assertFalse(any(change.startswith("Content outside bullets") for change in changes))
+
+
+if __name__ == '__main__':
+    unittest.main()
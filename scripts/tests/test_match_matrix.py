@@ -0,0 +1,52 @@
+"""Tests for batch match scoring."""
+
+import unittest
+
+from utils.keyword_matcher import calculate_match_matrix, calculate_match_score
+
+
+RESUMES = [
+    "Built REST APIs in Python on AWS; ran Kubernetes clusters with Terraform.",
+    "Led incident response and SOC 2 audits. Wrote Go services behind an API gateway.",
+    "Frontend work in TypeScript and React, deployed through GitHub Actions CI/CD.",
+    "",
+]
+
+JOBS = [
+    {'required': ['Python', 'AWS', 'Kubernetes', 'Terraform'], 'preferred': ['Go', 'React']},
+    {'required': ['SOC 2', 'incident response', 'Python'], 'preferred': ['Splunk']},
+    {'required': ['TypeScript', 'TypeScript', 'CI/CD'], 'preferred': []},
+    {'required': [], 'preferred': ['Amazon Web Services', 'K8s']},
+    {},
+]
+
+
+class MatchMatrixTest(unittest.TestCase):
+
+    def test_matrix_matches_scalar_scores(self):
+        matrix = calculate_match_matrix(RESUMES, JOBS)
+
+        for row, text in enumerate(RESUMES):
+            for col, job in enumerate(JOBS):
+                expected = calculate_match_score(text, job.get('required', []), job.get('preferred', []))
+                for key in ('overall_score', 'required_score', 'preferred_score'):
+                    with self.subTest(resume=row, job=col, score=key):
+                        self.assertEqual(matrix[key][row, col], expected[key])
+
+    def test_keyword_hits_list_found_keywords(self):
+        matrix = calculate_match_matrix(RESUMES, JOBS)
+        hits = matrix['keyword_hits']
+        keywords = matrix['keywords']
+
+        self.assertEqual(hits.shape, (len(RESUMES), len(keywords)))
+        self.assertIn('Python', [keywords[i] for i in hits.row(0)])
+        self.assertEqual(list(hits.row(3)), [])
+        self.assertEqual(int(hits.to_dense().sum()), len(hits.indices))
+
+    def test_empty_inputs(self):
+        self.assertEqual(calculate_match_matrix([], JOBS)['overall_score'].shape, (0, len(JOBS)))
+        self.assertEqual(calculate_match_matrix(RESUMES, [])['overall_score'].shape, (len(RESUMES), 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,8 @@ from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from typing import List, Dict, Any
 
+from .layout_estimator import DEFAULT_FONT_SIZE, Paragraph, TextRun, estimate_pages
+
 
 def read_docx_paragraphs(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -178,7 +180,9 @@ def add_experience_entry(doc: Document, experience: Dict[str, Any]) -> None:
     # Bullet points
     if experience.get('bullets'):
         for bullet in experience['bullets']:
-            bullet_para = doc.add_paragraph(bullet, style='List Bullet')
+            # Bullets may be parsed bullet dicts or plain strings
+            text = bullet.get('text', '') if isinstance(bullet, dict) else bullet
+            bullet_para = doc.add_paragraph(text, style='List Bullet')
             bullet_para.runs[0].font.size = Pt(10)
             # Reduce spacing between bullets
             bullet_para.paragraph_format.space_before = Pt(0)
@@ -284,32 +288,53 @@ def add_project_entry(doc: Document, project: Dict[str, Any]) -> None:
         tech_text.font.size = Pt(10)
 
 
-def estimate_page_count(doc: Document) -> float:
+def document_paragraphs(doc: Document) -> List[Paragraph]:
     """
-    Estimate the number of pages in a document.
-
-    This is a rough heuristic based on paragraph and character counts.
+    Describe a document's paragraphs for the layout estimator.
 
     Args:
         doc: Document object
 
     Returns:
-        Estimated page count
+        Paragraphs with their text runs, style and explicit spacing
     """
-    total_chars = 0
-    total_paragraphs = 0
+    paragraphs = []
 
     for para in doc.paragraphs:
-        if para.text.strip():
-            total_chars += len(para.text)
-            total_paragraphs += 1
+        runs = tuple(
+            TextRun(
+                run.text,
+                run.font.size.pt if run.font.size else DEFAULT_FONT_SIZE,
+                bool(run.bold),
+                bool(run.italic)
+            )
+            for run in para.runs if run.text
+        )
+        spacing = para.paragraph_format
+        paragraphs.append(Paragraph(
+            runs,
+            para.style.name if para.style else 'Normal',
+            spacing.space_before.pt if spacing.space_before is not None else None,
+            spacing.space_after.pt if spacing.space_after is not None else None
+        ))
+
+    return paragraphs
 
-    # Rough heuristic: ~3000 characters per page, ~40 paragraphs per page
-    char_estimate = total_chars / 3000
-    para_estimate = total_paragraphs / 40
 
-    # Average the two estimates
-    return (char_estimate + para_estimate) / 2
+def estimate_page_count(doc: Document) -> float:
+    """
+    Estimate the number of pages in a document.
+
+    Lays the paragraphs out with font metrics and line wrapping
+    (see ``layout_estimator``).
+
+    Args:
+        doc: Document object
+
+    Returns:
+        Estimated page count
+    """
+    return estimate_pages(document_paragraphs(doc))
 
 
 def save_document(doc: Document, output_path: str) -> None:
@@ -0,0 +1,277 @@
+"""
+Positional inverted index over experience bullets.
+
+Indexes every bullet of every experience once so that keyword context
+lookups and placement suggestions become dictionary lookups instead of
+rescanning experience text for each keyword.
+"""
+
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .keyword_matcher import normalize_keyword
+from .markdown_parser import load_all_experiences
+from .tokenizer import tokenize
+
+
+# Placement evidence weights, strongest first
+MENTION_WEIGHT = 4.0         # bullet text already contains the keyword
+BULLET_KEYWORD_WEIGHT = 3.0  # bullet's keywords: metadata lists the keyword
+EXPERIENCE_KEYWORD_WEIGHT = 2.0  # experience frontmatter lists the keyword
+BULLET_OVERLAP_WEIGHT = 1.0  # share of keyword tokens in bullet metadata
+EXPERIENCE_OVERLAP_WEIGHT = 0.5  # share of keyword tokens in frontmatter
+
+# Location of a keyword tag: (experience slug, bullet index or None for frontmatter)
+Location = Tuple[str, Optional[int]]
+
+
+def normalize_tag(keyword: str) -> str:
+    """Normalize a keyword tag for exact lookups ("CI/CD " -> "ci/cd")."""
+    return ' '.join(token.text for token in tokenize(str(keyword)))
+
+
+class ExperienceIndex:
+    """
+    Positional inverted index mapping tokens to bullet locations.
+
+    Each posting is (experience slug, bullet index, token position, start, end).
+    Phrases are resolved by intersecting postings of consecutive tokens, so
+    multi-word keywords like "incident response" need no separate entries.
+
+    A reverse index over keyword tags (frontmatter ``keywords`` and each
+    bullet's ``keywords:`` metadata) backs ranked placement suggestions.
+    """
+
+    def __init__(self, experiences: List[Dict[str, Any]]):
+        self.experiences = {exp.get('slug'): exp for exp in experiences}
+        self.postings: Dict[str, List[Tuple[str, int, int, int, int]]] = defaultdict(list)
+        self.tag_index: Dict[str, Set[Location]] = defaultdict(set)
+        self.tag_token_index: Dict[str, Set[Location]] = defaultdict(set)
+
+        for exp in experiences:
+            slug = exp.get('slug')
+
+            for bullet_index, bullet in enumerate(exp.get('bullets', [])):
+                tokens = tokenize(bullet.get('text', ''))
+                for position, (token, start, end) in enumerate(tokens):
+                    self.postings[token].append((slug, bullet_index, position, start, end))
+
+                for keyword in bullet.get('keywords', []):
+                    self._add_tag(keyword, (slug, bullet_index))
+
+            for keyword in exp.get('keywords', []):
+                self._add_tag(keyword, (slug, None))
+
+    def _add_tag(self, keyword: str, location: Location) -> None:
+        """Record a keyword tag under its normalized form and each of its tokens."""
+        tag = normalize_tag(keyword)
+        if not tag:
+            return
+
+        self.tag_index[tag].add(location)
+        for token in tag.split(' '):
+            self.tag_token_index[token].add(location)
+
+    def _find_spans(self, term: str) -> List[Tuple[str, int, int, int]]:
+        """Find (slug, bullet index, start, end) spans of a token or phrase."""
+        tokens = [token.text for token in tokenize(term)]
+        if not tokens:
+            return []
+
+        first = self.postings.get(tokens[0], [])
+        if len(tokens) == 1:
+            return [(slug, b, start, end) for slug, b, _, start, end in first]
+
+        # Map each later token's (slug, bullet, position) to its end offset
+        following = []
+        for token in tokens[1:]:
+            following.append({
+                (slug, b, pos): end
+                for slug, b, pos, _, end in self.postings.get(token, [])
+            })
+
+        spans = []
+        for slug, b, pos, start, end in first:
+            for offset, ends in enumerate(following, 1):
+                end = ends.get((slug, b, pos + offset))
+                if end is None:
+                    break
+            else:
+                spans.append((slug, b, start, end))
+
+        return spans
+
+    def lookup(self, term: str) -> List[Tuple[str, int, int]]:
+        """
+        Find every occurrence of a token or phrase across all bullets.
+
+        Args:
+            term: Token or multi-word phrase (normalized the same way as bullets)
+
+        Returns:
+            List of (experience slug, bullet index, char offset) tuples
+        """
+        return [(slug, b, start) for slug, b, start, _ in self._find_spans(term)]
+
+    def find_keyword_contexts(
+        self,
+        keyword: str,
+        context_chars: int = 50,
+        limit: int = 5
+    ) -> List[str]:
+        """
+        Find bullet snippets around occurrences of a keyword.
+
+        Args:
+            keyword: Keyword to find (all normalized variations are looked up)
+            context_chars: Number of characters of context on each side
+            limit: Maximum number of snippets to return
+
+        Returns:
+            List of context snippets
+        """
+        contexts = []
+        seen = set()
+
+        for var in normalize_keyword(keyword):
+            for slug, b, start, end in self._find_spans(var):
+                if (slug, b, start) in seen:
+                    continue
+                seen.add((slug, b, start))
+
+                text = self.experiences[slug]['bullets'][b].get('text', '')
+                context = text[max(0, start - context_chars):end + context_chars].strip()
+                contexts.append(f"...{context}...")
+
+                if len(contexts) >= limit:
+                    return contexts
+
+        return contexts
+
+    def rank_placements(self, keyword: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Rank the bullets where a keyword could best be placed.
+
+        Evidence is gathered from index lookups only: bullets whose text
+        already mentions the keyword, bullets and experiences tagged with
+        it, and partial token overlap with their tags. The top_k bullets by
+        combined weight are selected with a heap.
+
+        Args:
+            keyword: Keyword to place
+            top_k: Number of candidate bullets to return
+
+        Returns:
+            List of placement suggestions, best first
+        """
+        variations = {normalize_tag(var) for var in normalize_keyword(keyword)}
+        variations.discard('')
+        tokens = normalize_tag(keyword).split()
+
+        scores: Dict[Tuple[str, int], float] = defaultdict(float)
+        reasons: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+        def add(location: Tuple[str, int], weight: float, reason: str) -> None:
+            scores[location] += weight
+            if weight > reasons.get(location, (0.0, ''))[0]:
+                reasons[location] = (weight, reason)
+
+        def add_tagged(location: Location, weight: float, reason: str) -> None:
+            # Frontmatter evidence applies to every bullet of the experience
+            slug, bullet_index = location
+            if bullet_index is not None:
+                add(location, weight, reason)
+                return
+            for i in range(len(self.experiences[slug].get('bullets', []))):
+                add((slug, i), weight, reason)
+
+        mentioned = set()
+        for var in variations:
+            for slug, bullet_index, _, _ in self._find_spans(var):
+                mentioned.add((slug, bullet_index))
+            for location in self.tag_index.get(var, ()):
+                if location[1] is None:
+                    add_tagged(location, EXPERIENCE_KEYWORD_WEIGHT, f"Experience keywords include '{var}'")
+                else:
+                    add_tagged(location, BULLET_KEYWORD_WEIGHT, f"Bullet is tagged '{var}'")
+
+        for location in mentioned:
+            add(location, MENTION_WEIGHT, "Bullet already mentions it")
+
+        if tokens:
+            overlap: Dict[Location, int] = defaultdict(int)
+            for token in set(tokens):
+                for location in self.tag_token_index.get(token, ()):
+                    overlap[location] += 1
+
+            for location, shared in overlap.items():
+                fraction = shared / len(set(tokens))
+                if location[1] is None:
+                    add_tagged(location, EXPERIENCE_OVERLAP_WEIGHT * fraction, "Experience uses related skills")
+                else:
+                    add_tagged(location, BULLET_OVERLAP_WEIGHT * fraction, "Bullet uses related skills")
+
+        order = {slug: i for i, slug in enumerate(self.experiences)}
+
+        def rank_key(item):
+            (slug, bullet_index), score = item
+            bullet = self.experiences[slug]['bullets'][bullet_index]
+            # Higher score first, then higher bullet priority, then library order
+            return (score, -bullet.get('priority', 999), -order[slug], -bullet_index)
+
+        best = heapq.nlargest(top_k, scores.items(), key=rank_key)
+
+        suggestions = []
+        for (slug, bullet_index), score in best:
+            exp = self.experiences[slug]
+            bullet = exp['bullets'][bullet_index]
+            suggestions.append({
+                'keyword': keyword,
+                'experience_slug': slug,
+                'company': exp.get('company'),
+                'position': exp.get('position'),
+                'bullet_index': bullet_index,
+                'bullet_title': bullet.get('title', ''),
+                'score': round(score, 2),
+                'reason': f"{reasons[(slug, bullet_index)][1]} ({bullet.get('title', '')})"
+            })
+
+        return suggestions
+
+    def suggest_placements(
+        self,
+        missing_keywords: List[str],
+        max_suggestions: int = 5,
+        top_k: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest where missing keywords could be naturally added.
+
+        Args:
+            missing_keywords: Keywords not currently in resume
+            max_suggestions: Maximum number of keywords to suggest placements for
+            top_k: Number of ranked candidate bullets per keyword
+
+        Returns:
+            List of placement suggestions
+        """
+        suggestions = []
+
+        for keyword in missing_keywords[:max_suggestions]:
+            suggestions.extend(self.rank_placements(keyword, top_k))
+
+        return suggestions
+
+
+def build_experience_index(experiences_dir: str) -> ExperienceIndex:
+    """
+    Load all experiences from a directory and index their bullets.
+
+    Args:
+        experiences_dir: Path to experiences directory
+
+    Returns:
+        ExperienceIndex over every bullet in the directory
+    """
+    return ExperienceIndex(load_all_experiences(experiences_dir))
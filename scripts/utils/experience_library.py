@@ -0,0 +1,172 @@
+"""
+Lazy access to a directory of experience files.
+
+The library indexes experiences by slug from filenames alone. Frontmatter
+is read (without the markdown body) only when metadata such as priority
+is needed, and a file is fully parsed only when its experience is
+requested, so tailoring a few roles from a large library parses only
+those files.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+import yaml
+
+from .file_cache import ParsedFileCache
+from .markdown_parser import load_experience_cache, parse_experience_file
+from .models import Experience
+
+
+# Frontmatter delimiter line, as python-frontmatter recognizes it
+FRONTMATTER_BOUNDARY = re.compile(r'-{3,}\s*$')
+
+
+def read_frontmatter(file_path: str) -> Dict[str, Any]:
+    """
+    Read only the YAML frontmatter of a markdown file.
+
+    Lines are read up to the closing delimiter; the body is never loaded.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        Frontmatter metadata (empty if the file has none)
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = iter(f)
+        for line in lines:
+            if line.strip():
+                break
+        else:
+            return {}
+
+        if not FRONTMATTER_BOUNDARY.match(line.lstrip()):
+            return {}
+
+        header = []
+        for line in lines:
+            if FRONTMATTER_BOUNDARY.match(line):
+                metadata = yaml.safe_load(''.join(header))
+                return metadata if isinstance(metadata, dict) else {}
+            header.append(line)
+
+    return {}
+
+
+class ExperienceLibrary:
+    """
+    Slug-indexed experience files, parsed on demand.
+
+    Parsed experiences are memoized per library and go through the
+    directory's parsed-experience cache; call ``save`` to persist it.
+    """
+
+    def __init__(self, experiences_dir: str, use_cache: bool = True):
+        self.experiences_dir = experiences_dir
+        self.paths: Dict[str, str] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._experiences: Dict[str, Optional[Experience]] = {}
+        self._cache: Optional[ParsedFileCache] = None
+        self._use_cache = use_cache
+
+        if os.path.isdir(experiences_dir):
+            for filename in sorted(os.listdir(experiences_dir)):
+                if filename.endswith('.md'):
+                    slug = os.path.splitext(filename)[0]
+                    self.paths[slug] = os.path.join(experiences_dir, filename)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    @property
+    def cache(self) -> Optional[ParsedFileCache]:
+        """The directory's parsed-experience cache, loaded on first use."""
+        if self._cache is None and self._use_cache:
+            self._cache = load_experience_cache(self.experiences_dir)
+        return self._cache
+
+    def metadata(self, slug: str) -> Dict[str, Any]:
+        """
+        Frontmatter of an experience, without parsing its body.
+
+        Args:
+            slug: Experience slug (filename without .md)
+
+        Returns:
+            Frontmatter metadata, or an empty dict if unknown or unreadable
+        """
+        if slug not in self._metadata:
+            metadata = {}
+            path = self.paths.get(slug)
+            if path is not None:
+                try:
+                    metadata = read_frontmatter(path)
+                except Exception as e:
+                    print(f"Warning: Could not read frontmatter of {os.path.basename(path)}: {e}")
+            self._metadata[slug] = metadata
+        return self._metadata[slug]
+
+    def get(self, slug: str) -> Optional[Experience]:
+        """
+        Load one experience, parsing its file on first request.
+
+        Args:
+            slug: Experience slug (filename without .md)
+
+        Returns:
+            Experience, or None if there is no such file or it cannot be parsed
+        """
+        if slug not in self._experiences:
+            exp = None
+            path = self.paths.get(slug)
+            if path is not None:
+                try:
+                    exp = parse_experience_file(path, self.cache)
+                except Exception as e:
+                    print(f"Warning: Could not parse {os.path.basename(path)}: {e}")
+            self._experiences[slug] = exp
+        return self._experiences[slug]
+
+    def slugs_by_priority(self) -> List[str]:
+        """
+        Slugs ordered by frontmatter priority (lower number = higher priority).
+
+        Reads every file's frontmatter but no bodies. Ties keep name order.
+
+        Returns:
+            List of slugs
+        """
+        return sorted(self.paths, key=lambda slug: self.metadata(slug).get('priority', 999))
+
+    def top(self, count: int) -> List[Experience]:
+        """
+        Load the highest-priority experiences.
+
+        Args:
+            count: Number of experiences to load
+
+        Returns:
+            Up to count experiences, highest priority first
+        """
+        experiences = []
+        for slug in self.slugs_by_priority():
+            if len(experiences) == count:
+                break
+            exp = self.get(slug)
+            if exp is not None:
+                experiences.append(exp)
+        return experiences
+
+    def save(self) -> None:
+        """Persist any newly parsed files to the parsed-experience cache."""
+        if self._cache is not None:
+            self._cache.save()
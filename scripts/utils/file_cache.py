@@ -0,0 +1,201 @@
+"""
+Persistent cache of parsed source files.
+
+Parsed results are pickled next to the files they came from and reused
+while a file is unchanged. A file whose mtime and size match its entry is
+not even read; one whose mtime or size changed is re-hashed and only
+re-parsed if its content actually differs.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+
+# Bump when a cached parser's output changes shape, to discard old caches
+CACHE_VERSION = 2
+
+
+class CacheEntry(NamedTuple):
+    """A parsed file and the file state it was parsed from."""
+    mtime_ns: int
+    size: int
+    digest: str
+    data: Any
+
+
+def content_digest(raw: bytes) -> str:
+    """Short content hash used to detect real changes behind an mtime bump."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def parse_file(file_path: str, parse: Callable[[str, str], Any]) -> CacheEntry:
+    """
+    Read and parse a file, recording the state it was parsed from.
+
+    Safe to call in a worker process; the entry can be stored in a cache
+    by the parent.
+
+    Args:
+        file_path: Path to the source file
+        parse: Function of (text, file_path) returning the parsed result
+
+    Returns:
+        CacheEntry for the file
+    """
+    with open(file_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        raw = f.read()
+    data = parse(raw.decode('utf-8'), file_path)
+    return CacheEntry(stat.st_mtime_ns, stat.st_size, content_digest(raw), data)
+
+
+class ParsedFileCache:
+    """
+    Parsed results keyed by absolute file path, validated by mtime, size and
+    content hash.
+
+    Entries whose file has been deleted are evicted on save; entries whose
+    file changed are replaced as soon as the file is requested.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, CacheEntry] = {}
+        self._seen = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> 'ParsedFileCache':
+        """
+        Load a cache from disk, or start an empty one if it is missing,
+        unreadable or written by a different cache version.
+
+        Args:
+            path: Path to the cache file
+
+        Returns:
+            ParsedFileCache bound to path
+        """
+        cache = cls(path)
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return cache
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache {path}: {e}")
+            cache._dirty = True
+            return cache
+
+        if isinstance(data, dict) and data.get('version') == CACHE_VERSION:
+            cache.entries = {key: CacheEntry(*entry) for key, entry in data['entries'].items()}
+        else:
+            cache._dirty = True
+        return cache
+
+    def lookup(self, file_path: str) -> Optional[Any]:
+        """
+        Get the cached parse of a file if the file is unchanged.
+
+        A file whose mtime or size differs is hashed; if its content is the
+        same the entry is refreshed and still used.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            Parsed result shared with the cache (do not mutate), or None
+        """
+        key = os.path.abspath(file_path)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        stat = os.stat(key)
+        if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry.data
+
+        with open(key, 'rb') as f:
+            digest = content_digest(f.read())
+        if digest != entry.digest:
+            return None
+
+        self.entries[key] = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._dirty = True
+        return entry.data
+
+    def store(self, file_path: str, entry: CacheEntry) -> None:
+        """
+        Record a freshly parsed file, replacing any stale entry.
+
+        Args:
+            file_path: Path to the source file
+            entry: Result of ``parse_file``
+        """
+        key = os.path.abspath(file_path)
+        self._seen.add(key)
+        self.entries[key] = entry
+        self._dirty = True
+
+    def get(self, file_path: str, parse: Callable[[str, str], Any]) -> Any:
+        """
+        Get the parsed contents of a file, parsing it only if it changed.
+
+        The returned object is shared with the cache and must not be mutated.
+
+        Args:
+            file_path: Path to the source file
+            parse: Function of (text, file_path) returning the parsed result
+
+        Returns:
+            Parsed result
+        """
+        data = self.lookup(file_path)
+        if data is None:
+            entry = parse_file(file_path, parse)
+            self.store(file_path, entry)
+            data = entry.data
+        return data
+
+    def evict_missing(self) -> int:
+        """
+        Drop entries not requested this session whose file no longer exists.
+
+        Returns:
+            Number of entries evicted
+        """
+        missing = [
+            key for key in self.entries
+            if key not in self._seen and not os.path.exists(key)
+        ]
+        for key in missing:
+            del self.entries[key]
+        if missing:
+            self._dirty = True
+        return len(missing)
+
+    def save(self) -> None:
+        """Evict deleted files and write the cache atomically if it changed."""
+        self.evict_missing()
+        if not self._dirty or not self.path:
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                # Entries are stored as plain tuples so the file does not
+                # depend on the import path of this module
+                entries = {key: tuple(entry) for key, entry in self.entries.items()}
+                pickle.dump(
+                    {'version': CACHE_VERSION, 'entries': entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not write cache {self.path}: {e}")
+            return
+        self._dirty = False
@@ -0,0 +1,281 @@
+"""
+Fuzzy keyword matching within a bounded edit distance.
+
+Builds a SymSpell-style deletion dictionary over a resume vocabulary so a
+job keyword can be resolved to close resume terms ("Postgres" ->
+"PostgreSQL", "Kubernets" -> "Kubernetes") with a handful of dictionary
+lookups instead of an edit-distance scan over every token. Numeronyms
+("K8s", "i18n") are resolved through a separate exact lookup.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .tokenizer import normalize_text, tokenize
+
+
+# Numeronym such as "k8s" or "a11y"
+NUMERONYM_PATTERN = re.compile(r'^([a-z])(\d+)([a-z])$')
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance, giving up beyond max_distance.
+
+    Only a diagonal band of width 2 * max_distance + 1 is computed.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        Edit distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if a == b:
+        return 0
+
+    too_far = max_distance + 1
+    prev_prev: List[int] = []
+    prev = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [too_far] * (len(b) + 1)
+        current[0] = i
+        lo = max(1, i - max_distance)
+        hi = min(len(b), i + max_distance)
+
+        for j in range(lo, hi + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, prev_prev[j - 2] + 1)
+            current[j] = value
+
+        if min(current[lo - 1:hi + 1]) > max_distance:
+            return too_far
+
+        prev_prev, prev = prev, current
+
+    return prev[len(b)] if prev[len(b)] <= max_distance else too_far
+
+
+def numeronym(term: str) -> Optional[str]:
+    """
+    Numeronym of a single word ("kubernetes" -> "k8s"), if it has one.
+
+    Args:
+        term: Lowercase term
+
+    Returns:
+        Numeronym, or None for short or multi-word terms
+    """
+    if len(term) < 5 or not term.isalpha():
+        return None
+    return f"{term[0]}{len(term) - 2}{term[-1]}"
+
+
+class FuzzyIndex:
+    """
+    SymSpell deletion dictionary over a vocabulary of resume terms.
+
+    Every term is stored under all strings reachable by deleting up to
+    max_distance characters from its first prefix_length characters. A
+    query generates its own deletes the same way; any term sharing a
+    delete is a candidate and is verified with a bounded edit distance.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        max_distance: int = 2,
+        prefix_length: int = 7
+    ):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.terms: Set[str] = set()
+        self.deletes: Dict[str, Set[str]] = defaultdict(set)
+        self.numeronyms: Dict[str, Set[str]] = defaultdict(set)
+
+        for term in terms:
+            self.add(term)
+
+    def add(self, term: str) -> None:
+        """
+        Add a term to the index.
+
+        Args:
+            term: Resume term (word or phrase)
+        """
+        term = normalize_text(term).strip()
+        if not term or term in self.terms:
+            return
+
+        self.terms.add(term)
+        for variant in self._deletes(term[:self.prefix_length], self.max_distance):
+            self.deletes[variant].add(term)
+
+        short = numeronym(term)
+        if short:
+            self.numeronyms[short].add(term)
+
+    @staticmethod
+    def _deletes(word: str, max_distance: int) -> Set[str]:
+        """All strings reachable from word by up to max_distance deletions."""
+        results = {word}
+        frontier = {word}
+
+        for _ in range(max_distance):
+            next_frontier = set()
+            for item in frontier:
+                if len(item) <= 1:
+                    continue
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1:])
+            next_frontier -= results
+            results |= next_frontier
+            frontier = next_frontier
+
+        return results
+
+    def allowed_distance(self, term: str) -> int:
+        """
+        Edit distance allowed for a query term of this length.
+
+        Short terms must match exactly ("go" must not match "git"); the
+        allowance grows with length up to max_distance.
+        """
+        if len(term) < 4:
+            return 0
+        if len(term) < 7:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def lookup(self, term: str, max_distance: int = None) -> List[Tuple[str, int]]:
+        """
+        Find vocabulary terms within an edit distance of a query term.
+
+        Args:
+            term: Query term
+            max_distance: Override the length-based distance allowance
+
+        Returns:
+            List of (term, distance) tuples, closest first
+        """
+        term = normalize_text(term).strip()
+        if not term:
+            return []
+
+        if max_distance is None:
+            max_distance = self.allowed_distance(term)
+        max_distance = min(max_distance, self.max_distance)
+
+        if term in self.terms:
+            matches = {term: 0}
+            if max_distance == 0:
+                return [(term, 0)]
+        else:
+            matches = {}
+
+        candidates: Set[str] = set()
+        for variant in self._deletes(term[:self.prefix_length], max_distance):
+            candidates |= self.deletes.get(variant, set())
+
+        for candidate in candidates:
+            if candidate in matches:
+                continue
+            distance = bounded_edit_distance(term, candidate, max_distance)
+            if distance <= max_distance:
+                matches[candidate] = distance
+
+        return sorted(matches.items(), key=lambda x: (x[1], x[0]))
+
+    def resolve(self, keyword: str, max_distance: int = None) -> Optional[Tuple[str, int]]:
+        """
+        Resolve a job keyword to the closest resume term.
+
+        Numeronyms resolve both ways: "K8s" finds "kubernetes" and
+        "Kubernetes" finds "k8s" when only the short form is in the resume.
+
+        Args:
+            keyword: Job keyword
+            max_distance: Override the length-based distance allowance
+
+        Returns:
+            (resume term, distance) tuple, or None if nothing is close enough
+        """
+        keyword = normalize_text(keyword).strip()
+        if keyword in self.terms:
+            return keyword, 0
+
+        matches = self.lookup(keyword, max_distance)
+        if matches:
+            return matches[0]
+
+        match = NUMERONYM_PATTERN.match(keyword)
+        if match:
+            expansions = sorted(
+                term for term in self.numeronyms.get(keyword, ())
+                if len(term) == int(match.group(2)) + 2
+            )
+            if expansions:
+                return expansions[0], 0
+
+        short = numeronym(keyword)
+        if short and short in self.terms:
+            return short, 0
+
+        return None
+
+    def resolve_keywords(
+        self,
+        keywords: Iterable[str],
+        max_distance: int = None
+    ) -> Dict[str, Tuple[str, int]]:
+        """
+        Resolve several job keywords at once.
+
+        Args:
+            keywords: Job keywords
+            max_distance: Override the length-based distance allowance
+
+        Returns:
+            Dictionary of keyword -> (resume term, distance) for resolved keywords
+        """
+        resolved = {}
+        for keyword in keywords:
+            match = self.resolve(keyword, max_distance)
+            if match:
+                resolved[keyword] = match
+        return resolved
+
+
+def build_fuzzy_index(
+    texts: Iterable[str],
+    phrases: Iterable[str] = (),
+    max_distance: int = 2
+) -> FuzzyIndex:
+    """
+    Build a fuzzy index over the vocabulary of some resume texts.
+
+    Args:
+        texts: Resume texts whose tokens form the vocabulary
+        phrases: Extra multi-word terms to index whole (e.g. skills, tags)
+        max_distance: Largest edit distance the index supports
+
+    Returns:
+        FuzzyIndex over all tokens and phrases
+    """
+    index = FuzzyIndex((), max_distance=max_distance)
+
+    for text in texts:
+        for token in tokenize(text):
+            index.add(token.text)
+
+    for phrase in phrases:
+        index.add(phrase)
+
+    return index
@@ -0,0 +1,431 @@
+"""
+Keyword statistics over the archive of job descriptions.
+
+Streams job-description files in fixed-size chunks and counts keywords in
+a process pool, so memory use depends on the vocabulary size rather than
+on the size of the corpus. A persisted document-frequency store turns the
+archive into BM25 weights for ranking the keywords of a single posting.
+"""
+
+import hashlib
+import json
+import math
+import os
+import shutil
+from collections import Counter
+from glob import iglob
+from itertools import islice
+from multiprocessing import Pool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .keyword_matcher import MIN_PHRASE_FREQUENCY, count_keywords, get_synonym_dictionary, select_keywords
+
+
+def iter_job_description_paths(jobs_dir: str) -> Iterator[str]:
+    """
+    Lazily yield every job description file in a jobs directory.
+
+    Args:
+        jobs_dir: Path to the jobs directory (one subdirectory per job)
+
+    Yields:
+        Paths matching ``<jobs_dir>/*/job-description.md``
+    """
+    yield from iglob(os.path.join(jobs_dir, '*', 'job-description.md'))
+
+
+def iter_text_chunks(file_path: str, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Read a text file in chunks that never split a word.
+
+    Each chunk ends at the last whitespace character; the trailing partial
+    word is carried over into the next chunk.
+
+    Args:
+        file_path: Path to the text file
+        chunk_size: Number of characters to read at a time
+
+    Yields:
+        Text chunks
+    """
+    carry = ''
+
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+
+            block = carry + block
+            cut = max(block.rfind(' '), block.rfind('\n'), block.rfind('\t'))
+
+            if cut == -1:
+                carry = block
+                continue
+
+            carry = block[cut + 1:]
+            yield block[:cut + 1]
+
+    if carry:
+        yield carry
+
+
+def count_keywords_in_files(file_paths: Iterable[str], chunk_size: int = 1 << 16) -> Counter:
+    """
+    Count keywords across files, streaming each file chunk by chunk.
+
+    Args:
+        file_paths: Paths of text files to count
+        chunk_size: Number of characters to read at a time
+
+    Returns:
+        Counter of keyword frequencies over all files
+    """
+    counter = Counter()
+
+    for file_path in file_paths:
+        for chunk in iter_text_chunks(file_path, chunk_size):
+            count_keywords(chunk, counter)
+
+    return counter
+
+
+def _iter_batches(items: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    """Group an iterable into lists of at most batch_size items."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _count_batch(task: Tuple[List[str], int]) -> Counter:
+    """Worker entry point: count one batch of files."""
+    file_paths, chunk_size = task
+    return count_keywords_in_files(file_paths, chunk_size)
+
+
+def count_corpus_keywords(
+    file_paths: Iterable[str],
+    workers: int = None,
+    batch_size: int = 64,
+    chunk_size: int = 1 << 16
+) -> Counter:
+    """
+    Count keywords across a large corpus using a process pool.
+
+    Paths are consumed lazily and handed to workers in batches. Each worker
+    returns one Counter per batch, which is merged into the running total.
+
+    Args:
+        file_paths: Paths of text files to count (may be a generator)
+        workers: Number of worker processes (default: CPU count; 1 runs inline)
+        batch_size: Number of files per worker task
+        chunk_size: Number of characters each worker reads at a time
+
+    Returns:
+        Counter of keyword frequencies over the whole corpus
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = _iter_batches(file_paths, batch_size)
+
+    if workers == 1:
+        total = Counter()
+        for batch in batches:
+            total.update(count_keywords_in_files(batch, chunk_size))
+        return total
+
+    total = Counter()
+    with Pool(processes=workers) as pool:
+        tasks = ((batch, chunk_size) for batch in batches)
+        for counter in pool.imap_unordered(_count_batch, tasks):
+            total.update(counter)
+
+    return total
+
+
+def extract_keywords_from_corpus(
+    jobs_dir: str,
+    min_frequency: int = 2,
+    workers: int = None
+) -> List[Tuple[str, int]]:
+    """
+    Extract keywords across every job description under a jobs directory.
+
+    Streaming counterpart of ``extract_keywords_from_text`` for archives too
+    large to hold in memory.
+
+    Args:
+        jobs_dir: Path to the jobs directory
+        min_frequency: Minimum frequency for a keyword to be included
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        List of (keyword, frequency) tuples, sorted by frequency
+    """
+    word_freq = count_corpus_keywords(iter_job_description_paths(jobs_dir), workers=workers)
+
+    # Workers finish in any order, so break frequency ties alphabetically
+    keywords = [(word, freq) for word, freq in word_freq.items() if freq >= min_frequency]
+    keywords.sort(key=lambda x: (-x[1], x[0]))
+
+    return keywords
+
+
+class DocumentFrequencyStore:
+    """
+    Persisted document-frequency table over the job corpus, for BM25 ranking.
+
+    The store file holds only the document frequencies and each document's
+    content hash and length, so loading and saving cost O(vocabulary), not
+    O(archive). Each document's unique terms are kept in a small file of
+    its own under ``<store>.terms/``, read back only when that document is
+    re-analyzed and its previous contribution has to be replaced. An
+    unchanged posting is skipped; the rest of the archive is never re-read.
+
+    With max_ngram > 1 the terms include phrases, so phrases get their own
+    document frequencies. A posting only records the phrases
+    ``select_keywords`` could rank for it: those it repeats at least
+    MIN_PHRASE_FREQUENCY times, and multi-word dictionary terms. The
+    one-off word runs that make up most of a posting's phrases are never
+    stored. Document lengths always count single words.
+    """
+
+    def __init__(self, path: str = None, max_ngram: int = 1):
+        self.path = path
+        self.max_ngram = max_ngram
+        self.document_frequency: Counter = Counter()
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.total_length = 0
+
+        # Term lists not yet written (None marks a removed document), and
+        # whether term files from an earlier, discarded store must be cleared
+        self._pending_terms: Dict[str, Optional[List[str]]] = {}
+        self._clear_terms = False
+
+    @property
+    def terms_dir(self) -> Optional[str]:
+        """Directory of per-document term files, or None for an in-memory store."""
+        if self.path is None:
+            return None
+        return f"{os.path.splitext(self.path)[0]}.terms"
+
+    def _terms_path(self, doc_id: str) -> str:
+        return os.path.join(self.terms_dir, f"{doc_id}.json")
+
+    @classmethod
+    def load(cls, path: str, max_ngram: int = 1) -> 'DocumentFrequencyStore':
+        """
+        Load a store from disk, or start an empty one if the file is missing.
+
+        A store counted with a different max_ngram or phrase threshold is
+        discarded, since its terms would not match; it is rebuilt as
+        documents are added.
+
+        Args:
+            path: Path to the JSON store file
+            max_ngram: Longest phrase counted as a term, in words
+
+        Returns:
+            DocumentFrequencyStore bound to path
+        """
+        store = cls(path, max_ngram)
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if (data.get('max_ngram', 1) != max_ngram
+                    or data.get('min_phrase_frequency') != MIN_PHRASE_FREQUENCY):
+                store._clear_terms = True
+                return store
+            store.document_frequency = Counter(data.get('document_frequency', {}))
+            store.total_length = data.get('total_length', 0)
+            store.documents = data.get('documents', {})
+
+        return store
+
+    def save(self) -> None:
+        """Write the store and any changed term files to disk atomically."""
+        terms_dir = self.terms_dir
+        if self._clear_terms and os.path.isdir(terms_dir):
+            shutil.rmtree(terms_dir)
+        self._clear_terms = False
+
+        for doc_id, terms in self._pending_terms.items():
+            terms_path = self._terms_path(doc_id)
+            if terms is None:
+                if os.path.exists(terms_path):
+                    os.remove(terms_path)
+                continue
+            os.makedirs(terms_dir, exist_ok=True)
+            tmp_path = f"{terms_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(terms, f)
+            os.replace(tmp_path, terms_path)
+        self._pending_terms.clear()
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'max_ngram': self.max_ngram,
+                'min_phrase_frequency': MIN_PHRASE_FREQUENCY,
+                'total_length': self.total_length,
+                'document_frequency': self.document_frequency,
+                'documents': self.documents
+            }, f)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def document_count(self) -> int:
+        return len(self.documents)
+
+    def _count_terms(self, text: str) -> Tuple[Counter, int]:
+        """Count a text's terms and its length in single words."""
+        term_freq = count_keywords(text, max_ngram=self.max_ngram)
+        length = sum(freq for term, freq in term_freq.items() if ' ' not in term)
+        return term_freq, length
+
+    def _stored_terms(self, term_freq: Counter) -> List[str]:
+        """Terms of a document that count toward document frequencies."""
+        known_phrases = get_synonym_dictionary().phrases
+        return sorted(
+            term for term, freq in term_freq.items()
+            if ' ' not in term or freq >= MIN_PHRASE_FREQUENCY or term in known_phrases
+        )
+
+    def _document_terms(self, doc_id: str) -> List[str]:
+        """Unique terms recorded for a document, from memory or its term file."""
+        if doc_id in self._pending_terms:
+            return self._pending_terms[doc_id] or []
+        if self.terms_dir is None:
+            return []
+        try:
+            with open(self._terms_path(doc_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read terms of {doc_id}; its document frequencies stay counted: {e}")
+            return []
+
+    def remove_document(self, doc_id: str) -> None:
+        """
+        Remove a document's contribution from the statistics.
+
+        Args:
+            doc_id: Identifier the document was added under
+        """
+        doc = self.documents.pop(doc_id, None)
+        if doc is None:
+            return
+
+        terms = self._document_terms(doc_id)
+        self._pending_terms[doc_id] = None
+
+        self.total_length -= doc['length']
+        self.document_frequency.subtract(terms)
+        for term in terms:
+            if self.document_frequency[term] <= 0:
+                del self.document_frequency[term]
+
+    def add_document(self, doc_id: str, text: str) -> bool:
+        """
+        Add or update one document.
+
+        Args:
+            doc_id: Stable identifier (e.g. the job directory name)
+            text: Document text
+
+        Returns:
+            True if the statistics changed, False if the document was unchanged
+        """
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        existing = self.documents.get(doc_id)
+        if existing and existing['hash'] == content_hash:
+            return False
+
+        self.remove_document(doc_id)
+
+        term_freq, length = self._count_terms(text)
+        terms = self._stored_terms(term_freq)
+
+        self.documents[doc_id] = {'hash': content_hash, 'length': length}
+        self._pending_terms[doc_id] = terms
+        self.document_frequency.update(terms)
+        self.total_length += length
+
+        return True
+
+    def add_corpus(self, jobs_dir: str) -> int:
+        """
+        Add every job description under a jobs directory.
+
+        Documents are keyed by their job directory name, so this is cheap
+        to re-run: unchanged postings are skipped.
+
+        Args:
+            jobs_dir: Path to the jobs directory
+
+        Returns:
+            Number of documents added or updated
+        """
+        changed = 0
+        for file_path in iter_job_description_paths(jobs_dir):
+            doc_id = os.path.basename(os.path.dirname(file_path))
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                changed += self.add_document(doc_id, f.read())
+        return changed
+
+    def idf(self, term: str) -> float:
+        """
+        BM25 inverse document frequency of a term (always positive).
+
+        Args:
+            term: Normalized keyword
+
+        Returns:
+            IDF weight; terms found in most postings get weights near zero
+        """
+        n = self.document_count
+        df = self.document_frequency.get(term, 0)
+        return math.log((n - df + 0.5) / (df + 0.5) + 1)
+
+    def rank_keywords(
+        self,
+        text: str,
+        min_frequency: int = 1,
+        k1: float = 1.2,
+        b: float = 0.75
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank the keywords of a text by BM25 weight against the corpus.
+
+        Boilerplate that appears in most postings ("experience", "team")
+        sinks below the skills that distinguish this posting. With an empty
+        or single-document corpus every term has the same IDF, so the
+        ranking falls back to plain frequency order. Phrases are filtered
+        with ``select_keywords``.
+
+        Args:
+            text: Text to rank keywords for (a posting or one of its sections)
+            min_frequency: Minimum frequency in text for a keyword to be included
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+
+        Returns:
+            List of (keyword, score) tuples, sorted by score
+        """
+        term_freq, length = self._count_terms(text)
+        if self.max_ngram > 1:
+            term_freq = select_keywords(term_freq, min_frequency)
+        avg_length = (self.total_length / self.document_count) if self.document_count else length
+        norm = k1 * (1 - b + b * (length / avg_length if avg_length else 1))
+
+        ranked = [
+            (term, self.idf(term) * tf * (k1 + 1) / (tf + norm))
+            for term, tf in term_freq.items()
+            if tf >= min_frequency
+        ]
+        # Among equal scores, longer phrases are more specific
+        ranked.sort(key=lambda x: (x[1], x[0].count(' ')), reverse=True)
+
+        return ranked
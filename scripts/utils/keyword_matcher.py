@@ -2,10 +2,178 @@
 Keyword matching and optimization algorithms for resume tailoring.
 """
 
+import os
 import re
-from typing import Dict, List, Tuple, Set
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Set
+)
 from collections import Counter
 
+import yaml
+
+from .tokenizer import iter_tokens, normalize_text, tokenize
+
+if TYPE_CHECKING:
+    # Only calculate_match_matrix needs numpy; it imports it when called
+    import numpy as np
+
+
+# Synonym dictionary shipped with the repository
+DEFAULT_SYNONYMS_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data', 'keywords', 'synonyms.yaml'
+))
+
+# Fallback acronym expansions, used when no dictionary file can be read
+BUILTIN_ACRONYMS = {
+    'AI': ['AI', 'Artificial Intelligence', 'A.I.'],
+    'ML': ['ML', 'Machine Learning', 'M.L.'],
+    'API': ['API', 'APIs', 'Application Programming Interface'],
+    'CI/CD': ['CI/CD', 'CI', 'CD', 'Continuous Integration', 'Continuous Deployment'],
+    'AWS': ['AWS', 'Amazon Web Services'],
+    'GCP': ['GCP', 'Google Cloud Platform'],
+    'SQL': ['SQL', 'Structured Query Language'],
+    'REST': ['REST', 'RESTful', 'REST API'],
+    'JS': ['JS', 'JavaScript'],
+    'TS': ['TS', 'TypeScript'],
+    'CSS': ['CSS', 'Cascading Style Sheets'],
+    'HTML': ['HTML', 'HyperText Markup Language'],
+}
+
+
+class SynonymDictionary(NamedTuple):
+    """Compiled, read-only synonym lookups."""
+    acronyms: Mapping[str, Tuple[str, ...]]  # upper-case keyword -> expansions
+    synonyms: Mapping[str, Tuple[str, ...]]  # lower-case term -> its whole group
+    phrases: FrozenSet[str]  # multi-word terms, tokenized like extracted n-grams
+
+
+def compile_synonym_dictionary(
+    acronyms: Dict[str, List[str]],
+    synonyms: List[List[str]] = ()
+) -> SynonymDictionary:
+    """
+    Compile raw acronym expansions and synonym groups into frozen lookups.
+
+    A term listed in several groups maps to the union of those groups.
+
+    Args:
+        acronyms: Dictionary of acronym -> list of expansions
+        synonyms: List of groups of interchangeable terms
+
+    Returns:
+        SynonymDictionary of read-only mappings to tuples
+    """
+    acronym_lookup = {
+        str(key).upper(): tuple(dict.fromkeys(str(term) for term in terms))
+        for key, terms in (acronyms or {}).items()
+    }
+
+    groups: Dict[str, Dict[str, None]] = {}
+    for group in synonyms or ():
+        members = [str(term) for term in group]
+        for term in members:
+            groups.setdefault(term.lower(), {}).update(dict.fromkeys(members))
+
+    synonym_lookup = {term: tuple(members) for term, members in groups.items()}
+
+    terms = set(groups)
+    for expansions in acronym_lookup.values():
+        terms.update(term.lower() for term in expansions)
+
+    phrases = set()
+    for term in terms:
+        tokens = tokenize(term)
+        if len(tokens) > 1:
+            phrases.add(' '.join(token.text for token in tokens))
+
+    return SynonymDictionary(
+        MappingProxyType(acronym_lookup),
+        MappingProxyType(synonym_lookup),
+        frozenset(phrases)
+    )
+
+
+def load_synonym_dictionary(path: str = DEFAULT_SYNONYMS_PATH) -> SynonymDictionary:
+    """
+    Load and compile a synonym dictionary file.
+
+    The file is YAML with an ``acronyms`` mapping (one-way expansions,
+    looked up by the keyword in upper case) and a ``synonyms`` list of
+    groups (a keyword equal to any member expands to the whole group).
+    If the file cannot be read, the built-in acronym expansions are used.
+
+    Args:
+        path: Path to the synonym dictionary file
+
+    Returns:
+        Compiled SynonymDictionary
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)) or {}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"Warning: Could not load synonym dictionary {path}: {e}")
+        data = {'acronyms': BUILTIN_ACRONYMS}
+
+    return compile_synonym_dictionary(data.get('acronyms', {}), data.get('synonyms', []))
+
+
+_synonyms_path = DEFAULT_SYNONYMS_PATH
+_synonym_dictionary: Optional[SynonymDictionary] = None
+
+
+def get_synonym_dictionary() -> SynonymDictionary:
+    """
+    Get the active synonym dictionary, loading it on first use.
+
+    Returns:
+        Compiled SynonymDictionary
+    """
+    global _synonym_dictionary
+    if _synonym_dictionary is None:
+        _synonym_dictionary = load_synonym_dictionary(_synonyms_path)
+    return _synonym_dictionary
+
+
+def set_synonym_dictionary(path: str = DEFAULT_SYNONYMS_PATH) -> None:
+    """
+    Switch to a different synonym dictionary file.
+
+    Clears every cache derived from keyword variations, so matchers and
+    patterns compiled against the previous dictionary are not reused.
+
+    Args:
+        path: Path to the synonym dictionary file
+    """
+    global _synonyms_path, _synonym_dictionary
+    _synonyms_path = path
+    _synonym_dictionary = None
+
+    _normalize_keyword_cached.cache_clear()
+    _compile_keyword_matcher_cached.cache_clear()
+    _compile_variations_pattern.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_keyword_cached(keyword: str) -> Tuple[str, ...]:
+    """Compute the keyword variations once per distinct keyword."""
+    variations = [keyword, keyword.lower()]
+
+    # Add plural forms
+    if not keyword.endswith('s'):
+        variations.append(keyword + 's')
+        variations.append(keyword.lower() + 's')
+
+    dictionary = get_synonym_dictionary()
+    variations.extend(dictionary.acronyms.get(keyword.upper(), ()))
+    variations.extend(dictionary.synonyms.get(keyword.lower(), ()))
+
+    return tuple(dict.fromkeys(variations))
+
 
 def normalize_keyword(keyword: str) -> List[str]:
     """
@@ -15,130 +183,540 @@ def normalize_keyword(keyword: str) -> List[str]:
     - Original keyword
     - Lowercase version
     - Common acronyms and expansions
+    - Synonyms from the synonym dictionary
     - Plural forms
 
+    Results are memoized per keyword; each call returns a fresh list.
+
     Args:
         keyword: Keyword to normalize
 
     Returns:
         List of keyword variations
     """
-    variations = [keyword, keyword.lower()]
+    return list(_normalize_keyword_cached(keyword))
 
-    # Add plural forms
-    if not keyword.endswith('s'):
-        variations.append(keyword + 's')
-        variations.append(keyword.lower() + 's')
 
-    # Common tech acronym expansions
-    acronym_map = {
-        'AI': ['AI', 'Artificial Intelligence', 'A.I.'],
-        'ML': ['ML', 'Machine Learning', 'M.L.'],
-        'API': ['API', 'APIs', 'Application Programming Interface'],
-        'CI/CD': ['CI/CD', 'CI', 'CD', 'Continuous Integration', 'Continuous Deployment'],
-        'AWS': ['AWS', 'Amazon Web Services'],
-        'GCP': ['GCP', 'Google Cloud Platform'],
-        'SQL': ['SQL', 'Structured Query Language'],
-        'REST': ['REST', 'RESTful', 'REST API'],
-        'JS': ['JS', 'JavaScript'],
-        'TS': ['TS', 'TypeScript'],
-        'CSS': ['CSS', 'Cascading Style Sheets'],
-        'HTML': ['HTML', 'HyperText Markup Language'],
-    }
+# Common stop words excluded from keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'my', 'your', 'his', 'her', 'its', 'our', 'their', 'e.g', 'i.e'
+})
+
+
+# Longest phrase counted when n-gram extraction is enabled
+MAX_NGRAM = 4
+
+# Distinct phrases kept while counting one text before the rarest are pruned
+MAX_PHRASES = 50000
+
+# Times a phrase outside the synonym dictionary must occur to count as a keyword
+MIN_PHRASE_FREQUENCY = 2
+
+
+def _is_content_word(word: str) -> bool:
+    """Whether a token can be a keyword on its own (and start or end a phrase)."""
+    return len(word) > 2 and word[0].isalpha() and word not in STOP_WORDS
+
 
-    keyword_upper = keyword.upper()
-    if keyword_upper in acronym_map:
-        variations.extend(acronym_map[keyword_upper])
+def _prune_phrase_counts(phrase_freq: Counter, keep: int) -> Counter:
+    """Keep only the keep most frequent phrases."""
+    return Counter(dict(phrase_freq.most_common(keep)))
 
-    return list(set(variations))
 
+def count_keywords(
+    text: str,
+    counter: Counter = None,
+    max_ngram: int = 1,
+    max_phrases: int = MAX_PHRASES
+) -> Counter:
+    """
+    Count candidate keywords in text, skipping stop words and short words.
+
+    Words come from the shared tokenizer and must start with a letter.
+    With max_ngram > 1, phrases are counted in the same pass from a
+    rolling window of recent words: a phrase must start and end with a
+    content word (stop words may appear inside, as in "infrastructure as
+    code") and never spans punctuation or a line break. Phrases are counted separately and, whenever more than
+    max_phrases are held, pruned to the most frequent half.
+
+    Args:
+        text: Input text to analyze
+        counter: Existing counter to add to (a new one is created if omitted)
+        max_ngram: Longest phrase to count, in words (1 counts single words only)
+        max_phrases: Distinct phrases to hold before pruning rare ones
 
-def extract_keywords_from_text(text: str, min_frequency: int = 2) -> List[Tuple[str, int]]:
+    Returns:
+        Counter of keyword frequencies (phrases are space-joined words)
+    """
+    if counter is None:
+        counter = Counter()
+
+    tokens = tokenize(text)
+
+    if max_ngram <= 1:
+        counter.update(token.text for token in tokens if _is_content_word(token.text))
+        return counter
+
+    phrase_freq = Counter()
+    window: List[str] = []
+    last_end = 0
+
+    for word, start, end in tokens:
+        gap = text[last_end:start]
+        if gap.strip() or '\n' in gap:
+            window.clear()
+        last_end = end
+
+        window.append(word)
+        if len(window) > max_ngram:
+            del window[0]
+
+        if not _is_content_word(word):
+            continue
+
+        counter[word] += 1
+        for n in range(2, len(window) + 1):
+            if _is_content_word(window[-n]):
+                phrase_freq[' '.join(window[-n:])] += 1
+
+        if len(phrase_freq) > max_phrases:
+            phrase_freq = _prune_phrase_counts(phrase_freq, max_phrases // 2)
+
+    counter.update(phrase_freq)
+    return counter
+
+
+def select_keywords(
+    word_freq: Counter,
+    min_frequency: int = 2,
+    min_phrase_frequency: int = MIN_PHRASE_FREQUENCY
+) -> Counter:
+    """
+    Filter counted keywords down to the ones worth reporting.
+
+    Phrases are kept when they occur at least min_phrase_frequency times or
+    are multi-word terms from the synonym dictionary. A shorter keyword that
+    only ever occurs inside a kept phrase (same count) is dropped in favor
+    of the phrase, so "github actions" replaces "github" and "actions"
+    rather than appearing alongside them.
+
+    Args:
+        word_freq: Counter from count_keywords
+        min_frequency: Minimum frequency for any keyword
+        min_phrase_frequency: Minimum frequency for phrases not in the dictionary
+
+    Returns:
+        Counter of the selected keywords
+    """
+    known_phrases = get_synonym_dictionary().phrases
+    phrase_floor = max(min_frequency, min_phrase_frequency)
+
+    selected = Counter()
+    for term, freq in word_freq.items():
+        if freq < min_frequency:
+            continue
+        if ' ' in term and freq < phrase_floor and term not in known_phrases:
+            continue
+        selected[term] = freq
+
+    subsumed = set()
+    for term, freq in selected.items():
+        words = term.split(' ')
+        for n in range(1, len(words)):
+            for i in range(len(words) - n + 1):
+                part = ' '.join(words[i:i + n])
+                if part in selected and selected[part] == freq:
+                    subsumed.add(part)
+
+    for term in subsumed:
+        del selected[term]
+
+    return selected
+
+
+def extract_keywords_from_text(
+    text: str,
+    min_frequency: int = 2,
+    max_ngram: int = 1
+) -> List[Tuple[str, int]]:
     """
     Extract important keywords from text using frequency analysis.
 
     Args:
         text: Input text to analyze
         min_frequency: Minimum frequency for a keyword to be included
+        max_ngram: Longest phrase to extract, in words (see count_keywords)
 
     Returns:
         List of (keyword, frequency) tuples, sorted by frequency
     """
-    # Convert to lowercase
-    text_lower = text.lower()
-
-    # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-        'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'should', 'could', 'may', 'might', 'must', 'can', 'this', 'that',
-        'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-        'my', 'your', 'his', 'her', 'its', 'our', 'their'
-    }
+    word_freq = count_keywords(text, max_ngram=max_ngram)
 
-    # Extract words (including hyphenated words and acronyms)
-    words = re.findall(r'\b[a-z][a-z0-9\-/+#]*\b', text_lower)
+    # Filter by minimum frequency and sort
+    if max_ngram > 1:
+        keywords = list(select_keywords(word_freq, min_frequency).items())
+    else:
+        keywords = [(word, freq) for word, freq in word_freq.items() if freq >= min_frequency]
+    # Among equal frequencies, longer phrases are more specific
+    keywords.sort(key=lambda x: (x[1], x[0].count(' ')), reverse=True)
 
-    # Filter stop words and short words
-    filtered_words = [w for w in words if w not in stop_words and len(w) > 2]
+    return keywords
 
-    # Count frequencies
-    word_freq = Counter(filtered_words)
 
-    # Filter by minimum frequency and sort
-    keywords = [(word, freq) for word, freq in word_freq.items() if freq >= min_frequency]
-    keywords.sort(key=lambda x: x[1], reverse=True)
+def _classify_variations(keyword: str) -> List[Tuple[str, bool]]:
+    """
+    Variations of a keyword, each flagged if it must match as a whole word.
 
-    return keywords
+    The keyword and its plural keep substring matching; every acronym and
+    synonym form from the dictionary does not.
+    """
+    own_forms = {keyword, keyword.lower(), keyword + 's', keyword.lower() + 's'}
+    return [(var, var not in own_forms) for var in normalize_keyword(keyword)]
 
 
-def calculate_match_score(
-    resume_text: str,
-    required_keywords: List[str],
-    preferred_keywords: List[str] = None
-) -> Dict[str, any]:
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end + 1] is not embedded in a longer alphanumeric word."""
+    return not (
+        (text[start].isalnum() and start > 0 and text[start - 1].isalnum())
+        or (text[end].isalnum() and end + 1 < len(text) and text[end + 1].isalnum())
+    )
+
+
+class KeywordMatcher:
     """
-    Calculate keyword match score between resume and job requirements.
+    Compiled multi-pattern matcher for a fixed set of required/preferred keywords.
 
-    Args:
-        resume_text: Full text of resume
-        required_keywords: List of required keywords from job description
-        preferred_keywords: List of preferred keywords from job description
+    Every variation produced by ``normalize_keyword`` is normalized with the
+    shared tokenizer's ``normalize_text`` (as is every scanned text) and
+    loaded into a single Aho-Corasick automaton, so all keyword hits in a
+    text are found in one linear pass regardless of how many keywords or
+    variations there are. Build it once per keyword set and reuse it for
+    every resume.
 
-    Returns:
-        Dictionary with match analysis
+    By default a keyword and its plural match anywhere in the text, exactly
+    like the substring checks ``calculate_match_score`` has always used.
+    Acronym and synonym forms from the dictionary only match as whole words,
+    so "RAG" does not fire inside "storage" nor "HashiCorp Consul" inside
+    "consultant". With ``whole_words=True`` every variation, the keyword
+    included, only matches when it is not embedded in a longer alphanumeric
+    word (e.g. "Go" no longer matches "Google"). With
+    ``expand_variations=False`` only each keyword itself is matched.
     """
-    if preferred_keywords is None:
-        preferred_keywords = []
 
-    resume_lower = resume_text.lower()
+    def __init__(
+        self,
+        required_keywords: Iterable[str],
+        preferred_keywords: Optional[Iterable[str]] = None,
+        whole_words: bool = False,
+        expand_variations: bool = True
+    ):
+        self.required_keywords = list(required_keywords)
+        self.preferred_keywords = list(preferred_keywords or [])
+        self.whole_words = whole_words
+        self.expand_variations = expand_variations
+
+        # Unique keywords get integer ids; duplicates share an id
+        self.keywords = list(dict.fromkeys(self.required_keywords + self.preferred_keywords))
+        self._keyword_ids = {kw: i for i, kw in enumerate(self.keywords)}
+
+        # An empty variation matches any text, so it never enters the automaton.
+        # Patterns are keyed by (text, whole-word only)
+        patterns: Dict[Tuple[str, bool], Set[int]] = {}
+        self._always_ids: FrozenSet[int] = frozenset()
+        for kw_id, keyword in enumerate(self.keywords):
+            variations = _classify_variations(keyword) if expand_variations else [(keyword, False)]
+            for var, bounded in variations:
+                if var:
+                    patterns.setdefault((normalize_text(var), bounded), set()).add(kw_id)
+                else:
+                    self._always_ids |= {kw_id}
+
+        self._build_automaton(patterns)
+
+    def keyword_id(self, keyword: str) -> int:
+        """
+        Integer id of a compiled keyword.
+
+        Args:
+            keyword: Keyword exactly as passed to the matcher
+
+        Returns:
+            Index of the keyword in ``keywords``
+
+        Raises:
+            KeyError: If the keyword was not compiled into this matcher
+        """
+        return self._keyword_ids[keyword]
+
+    @property
+    def always_matched_ids(self) -> FrozenSet[int]:
+        """Ids of keywords with an empty variation, which match any text."""
+        return self._always_ids
+
+    def _build_automaton(self, patterns: Dict[Tuple[str, bool], Set[int]]) -> None:
+        """Build the trie, failure links and DFA transitions for the patterns."""
+        goto: List[Dict[str, int]] = [{}]
+        own_outputs: List[List[Tuple[int, FrozenSet[int], bool]]] = [[]]
+
+        for (pattern, bounded), kw_ids in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    own_outputs.append([])
+                node = nxt
+            own_outputs[node].append((len(pattern), frozenset(kw_ids), bounded))
+
+        # Breadth-first pass to compute failure links. Each state inherits the
+        # outputs and transitions of its failure state, which turns the trie
+        # into a DFA: matching is one dict lookup per character, no fail-chain walks
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{}] * len(goto)
+        outputs: List[Tuple[Tuple[int, FrozenSet[int], bool], ...]] = [()] * len(goto)
+        delta[0] = dict(goto[0])
+        outputs[0] = tuple(own_outputs[0])
+
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            transitions = dict(delta[fail[node]])
+            transitions.update(goto[node])
+            delta[node] = transitions
+            outputs[node] = tuple(own_outputs[node]) + outputs[fail[node]]
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0)
+                queue.append(child)
+
+        # Per state: keywords hit anywhere, and (length, ids) hits that need
+        # a word-boundary check
+        self._delta = delta
+        self._outputs = outputs
+        self._hits: List[FrozenSet[int]] = [
+            frozenset().union(*(ids for _, ids, bounded in out if not bounded))
+            for out in outputs
+        ]
+        self._bounded_hits: List[Tuple[Tuple[int, FrozenSet[int]], ...]] = [
+            tuple((length, ids) for length, ids, bounded in out if bounded)
+            for out in outputs
+        ]
+
+    def find_keyword_ids(self, text: str) -> Set[int]:
+        """
+        Find the ids of every keyword with at least one variation in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of indices into ``self.keywords``
+        """
+        text_lower = normalize_text(text)
+        found: Set[int] = set(self._always_ids)
+        total = len(self.keywords)
+
+        if self.whole_words:
+            for _, _, kw_ids in self._iter_matches(text_lower):
+                found |= kw_ids
+                if len(found) == total:
+                    break
+            return found
+
+        delta = self._delta
+        hits = self._hits
+        bounded_hits = self._bounded_hits
+        node = 0
+        for end, ch in enumerate(text_lower):
+            node = delta[node].get(ch, 0)
+            if hits[node]:
+                found |= hits[node]
+                if len(found) == total:
+                    break
+            for length, kw_ids in bounded_hits[node]:
+                if _is_whole_word(text_lower, end - length + 1, end):
+                    found |= kw_ids
+
+        return found
+
+    def _iter_matches(self, text_lower: str) -> Iterator[Tuple[int, int, FrozenSet[int]]]:
+        """Yield (start, end, keyword ids) for every variation match, by end offset."""
+        delta = self._delta
+        outputs = self._outputs
+        whole_words = self.whole_words
+
+        node = 0
+        for end, ch in enumerate(text_lower):
+            node = delta[node].get(ch, 0)
+            if not outputs[node]:
+                continue
 
-    # Check required keywords
-    required_matched = []
-    required_missing = []
+            for length, kw_ids, bounded in outputs[node]:
+                start = end - length + 1
+                if (whole_words or bounded) and not _is_whole_word(text_lower, start, end):
+                    continue
+                yield start, end + 1, kw_ids
 
-    for keyword in required_keywords:
-        variations = normalize_keyword(keyword)
-        found = any(var.lower() in resume_lower for var in variations)
+    def count_keyword_hits(self, text: str) -> Counter:
+        """
+        Count non-overlapping occurrences of each keyword in one pass.
 
-        if found:
-            required_matched.append(keyword)
-        else:
-            required_missing.append(keyword)
+        Overlapping variations of the same keyword (e.g. "API" inside
+        "APIs") count as a single occurrence.
 
-    # Check preferred keywords
-    preferred_matched = []
-    preferred_missing = []
+        Args:
+            text: Text to scan
 
-    for keyword in preferred_keywords:
-        variations = normalize_keyword(keyword)
-        found = any(var.lower() in resume_lower for var in variations)
+        Returns:
+            Counter of keyword -> number of occurrences
+        """
+        counts = Counter()
+        last_end: Dict[int, int] = {}
 
-        if found:
-            preferred_matched.append(keyword)
-        else:
-            preferred_missing.append(keyword)
+        for start, end, kw_ids in self._iter_matches(normalize_text(text)):
+            for kw_id in kw_ids:
+                if start >= last_end.get(kw_id, 0):
+                    counts[self.keywords[kw_id]] += 1
+                    last_end[kw_id] = end
+
+        return counts
+
+    def locate_keywords(
+        self,
+        segments: Iterable[Tuple[Hashable, str]]
+    ) -> Tuple[Dict[str, List[Hashable]], Dict[Hashable, Counter]]:
+        """
+        Attribute keyword occurrences to the segments of a document in one pass.
+
+        Segments are normalized and joined with newlines, which no variation
+        contains, so a single scan finds the same occurrences as scanning
+        each segment on its own.
+
+        Args:
+            segments: Iterable of (location, text) pairs, e.g. one per bullet
+
+        Returns:
+            Tuple of (keyword -> locations in document order,
+            location -> Counter of non-overlapping keyword occurrences).
+            Locations with no keywords are omitted.
+        """
+        locations: List[Hashable] = []
+        starts: List[int] = []
+        parts: List[str] = []
+        offset = 0
+        for location, text in segments:
+            normalized = normalize_text(text or '')
+            locations.append(location)
+            starts.append(offset)
+            parts.append(normalized)
+            offset += len(normalized) + 1
+
+        keyword_locations: Dict[str, List[Hashable]] = {}
+        location_counts: Dict[Hashable, Counter] = {}
+        last_end: Dict[int, int] = {}
+
+        for start, end, kw_ids in self._iter_matches('\n'.join(parts)):
+            location = locations[bisect_right(starts, start) - 1]
+            for kw_id in kw_ids:
+                if start < last_end.get(kw_id, 0):
+                    continue
+                last_end[kw_id] = end
+
+                keyword = self.keywords[kw_id]
+                counts = location_counts.setdefault(location, Counter())
+                if not counts[keyword]:
+                    keyword_locations.setdefault(keyword, []).append(location)
+                counts[keyword] += 1
+
+        return keyword_locations, location_counts
+
+    def find_keywords(self, text: str) -> Set[str]:
+        """
+        Find every keyword with at least one variation present in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched keywords (as originally supplied)
+        """
+        return {self.keywords[i] for i in self.find_keyword_ids(text)}
+
+    def score(self, text: str) -> Dict[str, Any]:
+        """
+        Score text against the compiled keyword set in a single pass.
+
+        Args:
+            text: Full text of resume
+
+        Returns:
+            Dictionary with match analysis (same shape as ``calculate_match_score``)
+        """
+        found = self.find_keyword_ids(text)
+        ids = self._keyword_ids
+        return _build_match_result(
+            self.required_keywords,
+            self.preferred_keywords,
+            lambda kw: ids[kw] in found
+        )
+
+
+@lru_cache(maxsize=128)
+def _compile_keyword_matcher_cached(
+    required_keywords: Tuple[str, ...],
+    preferred_keywords: Tuple[str, ...],
+    whole_words: bool,
+    expand_variations: bool
+) -> KeywordMatcher:
+    return KeywordMatcher(required_keywords, preferred_keywords, whole_words, expand_variations)
+
+
+def compile_keyword_matcher(
+    required_keywords: List[str],
+    preferred_keywords: List[str] = None,
+    whole_words: bool = False,
+    expand_variations: bool = True
+) -> KeywordMatcher:
+    """
+    Get a compiled matcher for a keyword set, reusing a cached one if possible.
+
+    Args:
+        required_keywords: List of required keywords from job description
+        preferred_keywords: List of preferred keywords from job description
+        whole_words: Only match variations on word boundaries
+        expand_variations: Match synonyms and plural forms, not just the keywords
+
+    Returns:
+        KeywordMatcher for the keyword set
+    """
+    return _compile_keyword_matcher_cached(
+        tuple(required_keywords),
+        tuple(preferred_keywords or ()),
+        whole_words,
+        expand_variations
+    )
+
+
+def _build_match_result(
+    required_keywords: List[str],
+    preferred_keywords: List[str],
+    is_found
+) -> Dict[str, Any]:
+    """
+    Assemble the match analysis dictionary from a keyword -> found predicate.
+    """
+    required_matched = [kw for kw in required_keywords if is_found(kw)]
+    required_missing = [kw for kw in required_keywords if not is_found(kw)]
+    preferred_matched = [kw for kw in preferred_keywords if is_found(kw)]
+    preferred_missing = [kw for kw in preferred_keywords if not is_found(kw)]
 
     # Calculate overall score
     # Required keywords: 70% weight, Preferred: 30% weight
@@ -160,38 +738,351 @@ def calculate_match_score(
     }
 
 
-def find_keyword_contexts(text: str, keyword: str, context_chars: int = 50) -> List[str]:
+def calculate_match_score(
+    resume_text: str,
+    required_keywords: List[str],
+    preferred_keywords: List[str] = None
+) -> Dict[str, any]:
+    """
+    Calculate keyword match score between resume and job requirements.
+
+    Uses a compiled ``KeywordMatcher`` (cached per keyword set), so all
+    required and preferred keywords are checked in one pass over the text.
+
+    Args:
+        resume_text: Full text of resume
+        required_keywords: List of required keywords from job description
+        preferred_keywords: List of preferred keywords from job description
+
+    Returns:
+        Dictionary with match analysis
+    """
+    matcher = compile_keyword_matcher(required_keywords, preferred_keywords)
+    return matcher.score(resume_text)
+
+
+class KeywordLocation(NamedTuple):
+    """Where in structured resume content a keyword occurs."""
+    section: str  # 'summary', 'experience', 'bullet' or 'skills'
+    key: Optional[str] = None  # experience slug (or position) or skill category
+    index: Optional[int] = None  # bullet index within the experience
+
+    def __str__(self) -> str:
+        if self.section == 'bullet':
+            return f"{self.key} bullet {self.index + 1}"
+        if self.key is None:
+            return self.section
+        return f"{self.section}:{self.key}"
+
+
+def iter_content_segments(content: Dict[str, Any]) -> Iterator[Tuple[KeywordLocation, str]]:
+    """
+    Split structured resume content into located text segments.
+
+    Each experience yields one segment for its header (company, position and
+    summary) and one per bullet; raw experiences without parsed bullets
+    yield their whole markdown body with the header.
+
+    Args:
+        content: Resume content with 'summary', 'experiences' and 'skills'
+
+    Yields:
+        (KeywordLocation, text) pairs in document order
+    """
+    if content.get('summary'):
+        yield KeywordLocation('summary'), content['summary']
+
+    for position, exp in enumerate(content.get('experiences', [])):
+        key = exp.get('slug') or str(position)
+        header = [exp.get('company', ''), exp.get('position', ''), exp.get('summary', '')]
+        bullets = exp.get('bullets')
+        if not bullets and exp.get('content'):
+            header.append(exp['content'])
+        yield KeywordLocation('experience', key), '\n'.join(header)
+
+        for index, bullet in enumerate(bullets or []):
+            yield KeywordLocation('bullet', key, index), bullet.get('text', '')
+
+    for skill_cat in content.get('skills', []):
+        yield (
+            KeywordLocation('skills', skill_cat.get('category', '')),
+            '\n'.join(skill_cat.get('keywords', []))
+        )
+
+
+def calculate_keyword_coverage(
+    segments: Iterable[Tuple[Hashable, str]],
+    required_keywords: List[str],
+    preferred_keywords: List[str] = None,
+    whole_words: bool = False
+) -> Dict[str, Any]:
+    """
+    Score located resume segments and record which segment carries each keyword.
+
+    The matcher runs once over all segments. A keyword counts as matched if
+    any segment contains it, so the scores equal ``calculate_match_score``
+    over the segments joined with newlines.
+
+    Args:
+        segments: Iterable of (location, text) pairs, e.g. from
+            ``iter_content_segments``
+        required_keywords: List of required keywords from job description
+        preferred_keywords: List of preferred keywords from job description
+        whole_words: Only match variations on word boundaries
+
+    Returns:
+        Dictionary with match analysis plus 'keyword_locations'
+        (keyword -> locations in document order) and 'location_counts'
+        (location -> {keyword: occurrences})
+    """
+    matcher = compile_keyword_matcher(required_keywords, preferred_keywords, whole_words)
+    keyword_locations, location_counts = matcher.locate_keywords(segments)
+
+    always = {matcher.keywords[i] for i in matcher.always_matched_ids}
+    result = _build_match_result(
+        matcher.required_keywords,
+        matcher.preferred_keywords,
+        lambda kw: kw in keyword_locations or kw in always
+    )
+    result['keyword_locations'] = keyword_locations
+    result['location_counts'] = {
+        location: dict(counts) for location, counts in location_counts.items()
+    }
+    return result
+
+
+def score_keyword_location(
+    coverage: Dict[str, Any],
+    location: Hashable,
+    required_keywords: List[str],
+    preferred_keywords: List[str] = None
+) -> Dict[str, Any]:
     """
-    Find all occurrences of a keyword with surrounding context.
+    Score a single location from a coverage map without rescanning its text.
+
+    Args:
+        coverage: Result of ``calculate_keyword_coverage``
+        location: Location to score
+        required_keywords: List of required keywords from job description
+        preferred_keywords: List of preferred keywords from job description
+
+    Returns:
+        Dictionary with match analysis for the location alone
+    """
+    found = coverage['location_counts'].get(location, {})
+    return _build_match_result(
+        list(required_keywords),
+        list(preferred_keywords or []),
+        lambda kw: kw in found
+    )
+
+
+def _round_scores(scores: 'np.ndarray') -> 'np.ndarray':
+    """
+    Round a score matrix to one decimal exactly like the builtin ``round``.
+
+    Scores take few distinct values, so each unique value is rounded in
+    Python and scattered back, keeping results identical to the scalar path.
+    """
+    import numpy as np
+
+    unique, inverse = np.unique(scores, return_inverse=True)
+    rounded = np.array([round(float(v), 1) for v in unique], dtype=np.float64)
+    return rounded[inverse].reshape(scores.shape)
+
+
+class KeywordHits(NamedTuple):
+    """
+    Sparse resume x keyword incidence in compressed-row form.
+
+    The keyword ids found in resume ``row`` are
+    ``indices[indptr[row]:indptr[row + 1]]``, in ascending order.
+    """
+    indptr: 'np.ndarray'  # int64, len(resumes) + 1 row offsets
+    indices: 'np.ndarray'  # int32 keyword ids, one per hit
+    shape: Tuple[int, int]  # (resumes, keywords)
+
+    def row(self, row: int) -> 'np.ndarray':
+        """Keyword ids found in one resume."""
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def to_dense(self) -> 'np.ndarray':
+        """Boolean resume x keyword matrix."""
+        import numpy as np
+
+        dense = np.zeros(self.shape, dtype=bool)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = True
+        return dense
+
+
+def calculate_match_matrix(
+    resume_texts: List[str],
+    job_keyword_sets: List[Dict[str, List[str]]]
+) -> Dict[str, Any]:
+    """
+    Score every resume against every job's keyword set in one batch.
+
+    Each resume is scanned exactly once with a ``KeywordMatcher`` compiled
+    over the union of all job keywords, producing a sparse resume x keyword
+    incidence (a resume hits only a small share of the union). Each job's
+    required and preferred keyword counts form dense keyword x job
+    matrices, so a resume's matched counts for every job are the sum of the
+    count rows of the keywords it hits, and the 70/30 weighting is applied
+    with array math.
+
+    Args:
+        resume_texts: List of full resume texts
+        job_keyword_sets: List of job keyword dictionaries with 'required'
+            and 'preferred' lists (the ``keywords`` section of a tailoring config)
+
+    Returns:
+        Dictionary with 'overall_score', 'required_score' and 'preferred_score'
+        arrays of shape (len(resume_texts), len(job_keyword_sets)), matching
+        ``calculate_match_score`` for each pair, plus the sparse
+        'keyword_hits' incidence and the 'keywords' it is indexed by
+    """
+    import numpy as np
+
+    required_sets = [job.get('required', []) or [] for job in job_keyword_sets]
+    preferred_sets = [job.get('preferred', []) or [] for job in job_keyword_sets]
+
+    all_keywords = [kw for kws in required_sets + preferred_sets for kw in kws]
+    matcher = compile_keyword_matcher(all_keywords)
+
+    # Sparse resume x keyword incidence, one linear scan per resume
+    indptr = np.zeros(len(resume_texts) + 1, dtype=np.int64)
+    rows = []
+    for row, text in enumerate(resume_texts):
+        found = sorted(matcher.find_keyword_ids(text))
+        rows.append(found)
+        indptr[row + 1] = indptr[row] + len(found)
+    indices = np.fromiter((kw_id for found in rows for kw_id in found), dtype=np.int32, count=int(indptr[-1]))
+    hits = KeywordHits(indptr, indices, (len(resume_texts), len(matcher.keywords)))
+
+    def keyword_job_counts(keyword_sets):
+        # Keyword x job counts; duplicates in a list count once per entry,
+        # as they do in the scalar scorer
+        counts = np.zeros((len(matcher.keywords), len(keyword_sets)), dtype=np.float64)
+        for col, kws in enumerate(keyword_sets):
+            for kw in kws:
+                counts[matcher.keyword_id(kw), col] += 1.0
+        totals = np.array([len(kws) for kws in keyword_sets], dtype=np.float64)
+        return counts, totals
+
+    def section_scores(keyword_sets):
+        counts, totals = keyword_job_counts(keyword_sets)
+        # Sum each resume's hit rows: prefix sums over the gathered rows,
+        # differenced at the row offsets (exact, since counts are integers)
+        prefix = np.zeros((len(indices) + 1, len(keyword_sets)), dtype=np.float64)
+        np.cumsum(counts[indices], axis=0, out=prefix[1:])
+        matched = prefix[indptr[1:]] - prefix[indptr[:-1]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = matched / totals * 100
+        return np.where(totals > 0, scores, 100.0)
+
+    required_score = section_scores(required_sets)
+    preferred_score = section_scores(preferred_sets)
+    overall_score = (required_score * 0.7) + (preferred_score * 0.3)
+
+    return {
+        'overall_score': _round_scores(overall_score),
+        'required_score': _round_scores(required_score),
+        'preferred_score': _round_scores(preferred_score),
+        'keyword_hits': hits,
+        'keywords': list(matcher.keywords)
+    }
+
+
+@lru_cache(maxsize=512)
+def _compile_variations_pattern(keyword: str) -> re.Pattern:
+    """
+    Compile all variations of a keyword into one case-insensitive pattern.
+
+    Longer variations come first so the alternation prefers the longest
+    match at each position. Acronym and synonym forms from the dictionary
+    only match as whole words, as in ``KeywordMatcher``.
+    """
+    variations = sorted(
+        {(var, bounded) for var, bounded in _classify_variations(keyword) if var},
+        key=lambda item: len(item[0]),
+        reverse=True
+    )
+    return re.compile(
+        '|'.join(
+            rf'(?<![^\W_]){re.escape(var)}(?![^\W_])' if bounded else re.escape(var)
+            for var, bounded in variations
+        ),
+        re.IGNORECASE
+    )
+
+
+def iter_keyword_contexts(text: str, keyword: str, context_chars: int = 50) -> Iterator[str]:
+    """
+    Lazily yield keyword occurrences with surrounding context.
+
+    All variations are matched by a single cached pattern, so snippets come
+    out in document order and the scan stops as soon as the caller stops
+    iterating. Matches that fall inside the previous snippet, and repeated
+    snippets, are skipped.
 
     Args:
         text: Text to search
         keyword: Keyword to find
         context_chars: Number of characters of context on each side
 
-    Returns:
-        List of context snippets
+    Yields:
+        Context snippets
     """
-    contexts = []
-    variations = normalize_keyword(keyword)
+    pattern = _compile_variations_pattern(keyword)
+    if not pattern.pattern:
+        return
+
+    previous_end = 0
+    seen = set()
+
+    for match in pattern.finditer(text):
+        if match.start() < previous_end:
+            continue
+
+        start = max(0, match.start() - context_chars)
+        end = min(len(text), match.end() + context_chars)
+        previous_end = end
+
+        context = text[start:end].strip()
+        if context in seen:
+            continue
+        seen.add(context)
+
+        yield f"...{context}..."
 
-    for var in variations:
-        pattern = re.compile(re.escape(var), re.IGNORECASE)
 
-        for match in pattern.finditer(text):
-            start = max(0, match.start() - context_chars)
-            end = min(len(text), match.end() + context_chars)
+def find_keyword_contexts(
+    text: str,
+    keyword: str,
+    context_chars: int = 50,
+    limit: int = 5
+) -> List[str]:
+    """
+    Find occurrences of a keyword with surrounding context.
 
-            context = text[start:end].strip()
-            contexts.append(f"...{context}...")
+    Args:
+        text: Text to search
+        keyword: Keyword to find
+        context_chars: Number of characters of context on each side
+        limit: Maximum number of contexts to return
 
-    return contexts[:5]  # Limit to 5 contexts
+    Returns:
+        List of context snippets, in document order
+    """
+    return list(islice(iter_keyword_contexts(text, keyword, context_chars), limit))
 
 
 def suggest_keyword_placements(
     experiences: List[Dict],
     missing_keywords: List[str],
-    max_suggestions: int = 5
+    max_suggestions: int = 5,
+    index: Any = None
 ) -> List[Dict[str, any]]:
     """
     Suggest where missing keywords could be naturally added.
@@ -200,10 +1091,15 @@ def suggest_keyword_placements(
         experiences: List of experience dictionaries
         missing_keywords: Keywords not currently in resume
         max_suggestions: Maximum number of suggestions to return
+        index: Optional ``ExperienceIndex`` over the experiences; when given,
+            suggestions come from index lookups instead of rescanning
 
     Returns:
         List of placement suggestions
     """
+    if index is not None:
+        return index.suggest_placements(missing_keywords, max_suggestions)
+
     suggestions = []
 
     for keyword in missing_keywords[:max_suggestions]:
@@ -235,32 +1131,41 @@ def optimize_keyword_distribution(
     """
     Analyze keyword distribution across resume sections.
 
+    Each section's words are counted from the shared tokenizer's token
+    stream, so punctuation and terms like "ci/cd" count the same way they
+    do in keyword extraction, and the section is scanned once by a compiled
+    ``KeywordMatcher`` that counts every keyword hit in that pass.
+
     Args:
         sections: Dictionary of section name -> text content
         keywords: List of important keywords
-        target_density: Target keyword density (keywords per 100 words)
+        target_density: Target keyword density (distinct keywords per word)
 
     Returns:
-        Analysis of keyword distribution by section
+        Analysis of keyword distribution by section, including per-keyword
+        hit counts and hits per 100 words
     """
+    matcher = compile_keyword_matcher(keywords)
     analysis = {}
 
     for section_name, section_text in sections.items():
-        word_count = len(section_text.split())
-        found_keywords = []
+        word_count = sum(1 for _ in iter_tokens(section_text))
+        keyword_hits = matcher.count_keyword_hits(section_text)
 
-        for keyword in keywords:
-            variations = normalize_keyword(keyword)
-            if any(var.lower() in section_text.lower() for var in variations):
-                found_keywords.append(keyword)
+        found_keywords = [kw for kw in keywords if keyword_hits[kw]]
+        hit_count = sum(keyword_hits.values())
 
         keyword_density = len(found_keywords) / word_count if word_count > 0 else 0
+        hits_per_100_words = hit_count / word_count * 100 if word_count > 0 else 0
 
         analysis[section_name] = {
             'keywords': found_keywords,
             'keyword_count': len(found_keywords),
+            'keyword_hits': dict(keyword_hits),
+            'hit_count': hit_count,
             'word_count': word_count,
             'density': round(keyword_density, 3),
+            'hits_per_100_words': round(hits_per_100_words, 1),
             'meets_target': keyword_density >= target_density
         }
 
@@ -0,0 +1,148 @@
+"""
+Keyword interning and bitset keyword sets.
+
+Keywords are interned into integer IDs once (case-insensitively), and a
+keyword list becomes an integer bitmask. Counting the keywords two lists
+share is then a single AND plus a popcount.
+"""
+
+from typing import Dict, Iterable, List
+
+
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+else:  # Python < 3.10
+    def popcount(mask: int) -> int:
+        return bin(mask).count('1')
+
+
+class KeywordVocabulary:
+    """
+    Case-insensitive mapping of keywords to integer IDs.
+
+    IDs are assigned on first sight and never change, so masks built at
+    different times stay comparable.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.keywords: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def intern(self, keyword: str) -> int:
+        """
+        Get the ID for a keyword, assigning a new one if needed.
+
+        Args:
+            keyword: Keyword in any case
+
+        Returns:
+            Integer keyword ID
+        """
+        key = str(keyword).lower()
+        keyword_id = self.ids.get(key)
+
+        if keyword_id is None:
+            keyword_id = len(self.keywords)
+            self.ids[key] = keyword_id
+            self.keywords.append(key)
+
+        return keyword_id
+
+    def mask(self, keywords: Iterable[str]) -> int:
+        """
+        Build the bitmask for a keyword list, interning new keywords.
+
+        Args:
+            keywords: Keywords in any case
+
+        Returns:
+            Integer with one bit set per distinct keyword
+        """
+        mask = 0
+        for keyword in keywords:
+            mask |= 1 << self.intern(keyword)
+        return mask
+
+    def known_mask(self, keywords: Iterable[str]) -> int:
+        """
+        Build the bitmask of the keywords already in the vocabulary.
+
+        Unknown keywords get no bit and are not interned, so looking up a
+        keyword list never grows the vocabulary.
+
+        Args:
+            keywords: Keywords in any case
+
+        Returns:
+            Integer with one bit set per distinct known keyword
+        """
+        mask = 0
+        ids = self.ids
+        for keyword in keywords:
+            keyword_id = ids.get(str(keyword).lower())
+            if keyword_id is not None:
+                mask |= 1 << keyword_id
+        return mask
+
+    def decode(self, mask: int) -> List[str]:
+        """
+        List the (lowercased) keywords whose bits are set in a mask.
+
+        Args:
+            mask: Keyword bitmask
+
+        Returns:
+            Keywords in ID order
+        """
+        return [kw for i, kw in enumerate(self.keywords) if mask >> i & 1]
+
+
+# Shared vocabulary of library keywords, interned as experiences and
+# bullets are loaded; job keywords are only looked up (see known_keyword_mask)
+VOCABULARY = KeywordVocabulary()
+
+
+def keyword_mask(keywords: Iterable[str]) -> int:
+    """
+    Build a bitmask in the shared vocabulary.
+
+    Args:
+        keywords: Keywords in any case
+
+    Returns:
+        Keyword bitmask
+    """
+    return VOCABULARY.mask(keywords)
+
+
+def known_keyword_mask(keywords: Iterable[str]) -> int:
+    """
+    Build a bitmask in the shared vocabulary without interning.
+
+    A keyword the vocabulary does not hold cannot be in any interned mask,
+    so leaving it out loses no shared keywords.
+
+    Args:
+        keywords: Keywords in any case
+
+    Returns:
+        Keyword bitmask of the known keywords
+    """
+    return VOCABULARY.known_mask(keywords)
+
+
+def count_shared_keywords(mask_a: int, mask_b: int) -> int:
+    """
+    Count keywords present in both masks.
+
+    Args:
+        mask_a: Keyword bitmask
+        mask_b: Keyword bitmask
+
+    Returns:
+        Number of shared keywords
+    """
+    return popcount(mask_a & mask_b)
@@ -0,0 +1,429 @@
+"""
+Font-metric page estimation for generated resumes.
+
+Lays resume content out the way ``docx_handler`` renders it: glyph advance
+widths for the body font at the sizes and weights each paragraph uses,
+greedy line wrapping across the 7.5" text width left by the 0.5" margins of
+``create_ats_document``, and Word's paragraph spacing and line height.
+Wrapped heights are memoized per paragraph (its text runs and style), so
+re-estimating content that changed by one bullet only wraps that bullet.
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Letter page less the 0.5" margins set by create_ats_document, in points
+PAGE_TEXT_WIDTH = (8.5 - 2 * 0.5) * 72
+PAGE_TEXT_HEIGHT = (11 - 2 * 0.5) * 72
+
+# python-docx's default template: 11pt Cambria body text, 1.15 line spacing
+# (w:line="276") and 10pt after each paragraph (w:after="200")
+DEFAULT_FONT_SIZE = 11.0
+LINE_SPACING = 276 / 240
+DEFAULT_SPACE_AFTER = 10.0
+
+# Cambria's line height (ascent + descent) as a multiple of the font size
+FONT_LINE_HEIGHT = 2401 / 2048
+
+# Approximate Cambria Regular advance widths, in 1/1000 em
+GLYPH_WIDTHS: Dict[str, int] = {
+    ' ': 220, '!': 304, '"': 405, '#': 552, '$': 552, '%': 790, '&': 703, "'": 232,
+    '(': 342, ')': 342, '*': 456, '+': 552, ',': 239, '-': 334, '.': 239, '/': 382,
+    '0': 552, '1': 552, '2': 552, '3': 552, '4': 552, '5': 552, '6': 552, '7': 552,
+    '8': 552, '9': 552, ':': 239, ';': 239, '<': 552, '=': 552, '>': 552, '?': 452,
+    '@': 854, 'A': 671, 'B': 636, 'C': 640, 'D': 714, 'E': 593, 'F': 559, 'G': 704,
+    'H': 764, 'I': 343, 'J': 414, 'K': 680, 'L': 553, 'M': 866, 'N': 734, 'O': 726,
+    'P': 593, 'Q': 726, 'R': 660, 'S': 522, 'T': 622, 'U': 737, 'V': 663, 'W': 1000,
+    'X': 654, 'Y': 618, 'Z': 575, '[': 342, '\\': 382, ']': 342, '^': 552, '_': 456,
+    '`': 552, 'a': 495, 'b': 555, 'c': 461, 'd': 555, 'e': 494, 'f': 321, 'g': 496,
+    'h': 571, 'i': 287, 'j': 272, 'k': 533, 'l': 280, 'm': 854, 'n': 571, 'o': 537,
+    'p': 555, 'q': 555, 'r': 420, 's': 427, 't': 333, 'u': 571, 'v': 493, 'w': 750,
+    'x': 491, 'y': 493, 'z': 435, '{': 342, '|': 272, '}': 342, '~': 552,
+    '•': 350, '–': 552, '—': 1000, '‘': 232, '’': 232,
+    '“': 405, '”': 405, '…': 717, ' ': 220,
+}
+
+# Width of any glyph missing from the table, in 1/1000 em
+DEFAULT_GLYPH_WIDTH = 520
+
+# Cambria Bold and Italic widths relative to Regular
+BOLD_WIDTH_SCALE = 1.06
+ITALIC_WIDTH_SCALE = 0.96
+
+# Wrapped paragraph heights kept between estimates
+LAYOUT_CACHE_SIZE = 16384
+
+
+class TextRun(NamedTuple):
+    """A run of text in one size and weight, as docx_handler adds it."""
+    text: str
+    size: float = DEFAULT_FONT_SIZE
+    bold: bool = False
+    italic: bool = False
+
+
+class ParagraphStyle(NamedTuple):
+    """Paragraph geometry of a document style, in points."""
+    indent: float = 0.0
+    space_before: float = 0.0
+    space_after: float = DEFAULT_SPACE_AFTER
+    contextual_spacing: bool = False
+
+
+# Styles docx_handler uses; List Bullet indents 0.25" and drops the space
+# between consecutive bullets
+PARAGRAPH_STYLES: Dict[str, ParagraphStyle] = {
+    'Normal': ParagraphStyle(),
+    'List Bullet': ParagraphStyle(indent=18.0, contextual_spacing=True),
+}
+
+
+class Paragraph(NamedTuple):
+    """A paragraph to lay out; spacing of None falls back to the style's."""
+    runs: Tuple[TextRun, ...] = ()
+    style: str = 'Normal'
+    space_before: Optional[float] = None
+    space_after: Optional[float] = None
+
+
+def _glyph_widths(runs: Tuple[TextRun, ...]) -> Tuple[str, List[float]]:
+    """Text of the runs and each character's advance width in points."""
+    widths = []
+    for run in runs:
+        scale = run.size / 1000
+        if run.bold:
+            scale *= BOLD_WIDTH_SCALE
+        if run.italic:
+            scale *= ITALIC_WIDTH_SCALE
+        widths.extend(GLYPH_WIDTHS.get(ch, DEFAULT_GLYPH_WIDTH) * scale for ch in run.text)
+    return ''.join(run.text for run in runs), widths
+
+
+def text_width(text: str, size: float = DEFAULT_FONT_SIZE, bold: bool = False, italic: bool = False) -> float:
+    """
+    Width of a single line of text, in points.
+
+    Args:
+        text: Text to measure
+        size: Font size in points
+        bold: Bold weight
+        italic: Italic style
+
+    Returns:
+        Sum of the glyph advance widths
+    """
+    return sum(_glyph_widths((TextRun(text, size, bold, italic),))[1])
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def count_wrapped_lines(runs: Tuple[TextRun, ...], available_width: float) -> int:
+    """
+    Count the lines a paragraph wraps to, breaking like Word does.
+
+    Lines break at spaces (which may overhang the right edge) and after
+    hyphens; a word wider than the line is broken between characters.
+
+    Args:
+        runs: The paragraph's text runs
+        available_width: Line width in points
+
+    Returns:
+        Number of lines (1 for an empty paragraph)
+    """
+    text, widths = _glyph_widths(runs)
+    lines = 1
+    line_width = 0.0
+    word_width = 0.0
+
+    def place(word: float) -> None:
+        nonlocal lines, line_width
+        if line_width and line_width + word > available_width:
+            lines += 1
+            line_width = 0.0
+        line_width += word
+        while line_width > available_width:
+            lines += 1
+            line_width -= available_width
+
+    for ch, width in zip(text, widths):
+        if ch == '\n':
+            place(word_width)
+            word_width = 0.0
+            lines += 1
+            line_width = 0.0
+        elif ch == ' ':
+            place(word_width)
+            word_width = 0.0
+            line_width += width
+        else:
+            word_width += width
+            if ch == '-':
+                place(word_width)
+                word_width = 0.0
+
+    place(word_width)
+    return lines
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def line_height(paragraph: Paragraph) -> float:
+    """Height of one line of a paragraph, from its largest run, in points."""
+    size = max((run.size for run in paragraph.runs), default=DEFAULT_FONT_SIZE)
+    return size * FONT_LINE_HEIGHT * LINE_SPACING
+
+
+def paragraph_text_height(paragraph: Paragraph) -> float:
+    """
+    Height of a paragraph's wrapped lines, without spacing.
+
+    Args:
+        paragraph: Paragraph to lay out
+
+    Returns:
+        Height in points
+    """
+    style = PARAGRAPH_STYLES.get(paragraph.style, PARAGRAPH_STYLES['Normal'])
+    lines = count_wrapped_lines(paragraph.runs, PAGE_TEXT_WIDTH - style.indent)
+    return lines * line_height(paragraph)
+
+
+def layout_height(paragraphs: Iterable[Paragraph]) -> float:
+    """
+    Total height of paragraphs laid out in sequence, in points.
+
+    Space before and after each paragraph is added, except between
+    consecutive paragraphs of a style with contextual spacing.
+
+    Args:
+        paragraphs: Paragraphs in document order
+
+    Returns:
+        Height in points
+    """
+    height = 0.0
+    previous = None
+    for paragraph in paragraphs:
+        style = PARAGRAPH_STYLES.get(paragraph.style, PARAGRAPH_STYLES['Normal'])
+        before = style.space_before if paragraph.space_before is None else paragraph.space_before
+        if previous is not None:
+            prev_style, prev_after = previous
+            if not (style.contextual_spacing and prev_style == paragraph.style):
+                height += prev_after + before
+        else:
+            height += before
+
+        height += paragraph_text_height(paragraph)
+        after = style.space_after if paragraph.space_after is None else paragraph.space_after
+        previous = (paragraph.style, after)
+
+    if previous is not None:
+        height += previous[1]
+    return height
+
+
+def estimate_pages(paragraphs: Iterable[Paragraph]) -> float:
+    """
+    Estimate the page count of laid-out paragraphs.
+
+    Args:
+        paragraphs: Paragraphs in document order
+
+    Returns:
+        Estimated page count
+    """
+    return layout_height(paragraphs) / PAGE_TEXT_HEIGHT
+
+
+# Paragraph layouts mirroring docx_handler's add_* functions and
+# tailor_resume.generate_resume_docx
+
+
+def _paragraph(*runs: TextRun, style: str = 'Normal', **spacing: float) -> Paragraph:
+    return Paragraph(tuple(run for run in runs if run.text), style, **spacing)
+
+
+BLANK_PARAGRAPH = Paragraph()
+
+
+def layout_contact_header(basics: Mapping) -> List[Paragraph]:
+    """Paragraphs of add_contact_header."""
+    paragraphs = [_paragraph(TextRun(basics.get('name', '') or '', 16, bold=True))]
+
+    contact_parts = []
+    if basics.get('email'):
+        contact_parts.append(basics['email'])
+    if basics.get('phone'):
+        contact_parts.append(basics['phone'])
+    if basics.get('location', {}).get('city'):
+        location = basics['location']
+        loc_str = f"{location.get('city', '')}, {location.get('region', '')}"
+        contact_parts.append(loc_str.strip(', '))
+    if contact_parts:
+        paragraphs.append(_paragraph(TextRun(' • '.join(contact_parts), 10)))
+
+    links = []
+    if basics.get('url'):
+        links.append(basics['url'])
+    for profile in basics.get('profiles') or []:
+        if profile.get('network') == 'LinkedIn' and profile.get('url'):
+            links.append(profile['url'])
+    if links:
+        paragraphs.append(_paragraph(TextRun(' • '.join(links), 9)))
+
+    paragraphs.append(BLANK_PARAGRAPH)
+    return paragraphs
+
+
+def layout_section_header(title: str) -> List[Paragraph]:
+    """Paragraphs of add_section_header."""
+    return [_paragraph(TextRun(title.upper(), 12, bold=True))]
+
+
+def bullet_paragraph(bullet: Any) -> Paragraph:
+    """
+    Paragraph of one experience bullet, as add_experience_entry adds it.
+
+    Args:
+        bullet: Bullet mapping with 'text', or a plain string
+
+    Returns:
+        List Bullet paragraph
+    """
+    text = bullet.get('text', '') if isinstance(bullet, Mapping) else bullet
+    return _paragraph(TextRun(text or '', 10), style='List Bullet', space_before=0.0, space_after=2.0)
+
+
+def layout_experience(experience: Mapping) -> List[Paragraph]:
+    """Paragraphs of add_experience_entry."""
+    runs = [TextRun(experience.get('position', '') or '', 11, bold=True)]
+    if experience.get('company'):
+        runs.append(TextRun(f" | {experience['company']}", 11))
+    paragraphs = [_paragraph(*runs)]
+
+    info_parts = []
+    if experience.get('location'):
+        info_parts.append(experience['location'])
+    start = experience.get('startDate', '')
+    if start:
+        info_parts.append(f"{start} - {experience.get('endDate', 'Present')}")
+    if info_parts:
+        paragraphs.append(_paragraph(TextRun(' | '.join(info_parts), 10, italic=True)))
+
+    if experience.get('summary'):
+        paragraphs.append(_paragraph(TextRun(experience['summary'], 10)))
+
+    paragraphs.extend(bullet_paragraph(bullet) for bullet in experience.get('bullets') or [])
+    paragraphs.append(BLANK_PARAGRAPH)
+    return paragraphs
+
+
+def layout_skills(skills: Iterable[Mapping]) -> List[Paragraph]:
+    """Paragraphs of add_skills_section."""
+    paragraphs = []
+    for skill_category in skills:
+        keywords = skill_category.get('keywords', [])
+        if keywords:
+            paragraphs.append(_paragraph(
+                TextRun(f"{skill_category.get('category', '')}: ", 10, bold=True),
+                TextRun(', '.join(keywords), 10)
+            ))
+    return paragraphs
+
+
+def layout_education(education: Mapping) -> List[Paragraph]:
+    """Paragraphs of add_education_entry."""
+    runs = [TextRun(f"{education.get('studyType', '')} in {education.get('area', '')}", 11, bold=True)]
+    if education.get('institution'):
+        runs.append(TextRun(f" | {education['institution']}", 11))
+    paragraphs = [_paragraph(*runs)]
+
+    info_parts = []
+    if education.get('endDate'):
+        info_parts.append(str(education['endDate']))
+    if education.get('gpa'):
+        info_parts.append(f"GPA: {education['gpa']}")
+    if info_parts:
+        paragraphs.append(_paragraph(TextRun(' | '.join(info_parts), 10, italic=True)))
+    return paragraphs
+
+
+def layout_project(project: Mapping) -> List[Paragraph]:
+    """Paragraphs of add_project_entry."""
+    runs = [TextRun(project.get('name', '') or '', 11, bold=True)]
+    if project.get('url'):
+        runs.append(TextRun(f" | {project['url']}", 9))
+    paragraphs = [_paragraph(*runs)]
+
+    if project.get('description'):
+        paragraphs.append(_paragraph(TextRun(project['description'], 10)))
+    if project.get('technologies'):
+        paragraphs.append(_paragraph(
+            TextRun('Technologies: ', 10, italic=True),
+            TextRun(', '.join(project['technologies']), 10)
+        ))
+    return paragraphs
+
+
+def layout_resume_sections(content: Mapping) -> Dict[str, List[Paragraph]]:
+    """
+    Paragraphs of a generated resume, grouped by section in document order.
+
+    Args:
+        content: Resume content with basics, summary, experiences, skills,
+            projects and education
+
+    Returns:
+        Section name -> paragraphs ('header', 'summary', 'experiences',
+        'skills', 'projects', 'education')
+    """
+    sections: Dict[str, List[Paragraph]] = {
+        'header': layout_contact_header(content.get('basics') or {}),
+        'summary': [],
+        'experiences': [],
+        'skills': [],
+        'projects': [],
+        'education': []
+    }
+
+    if content.get('summary'):
+        sections['summary'] = layout_section_header('Professional Summary') + [
+            _paragraph(TextRun(content['summary'], 10)), BLANK_PARAGRAPH
+        ]
+
+    if content.get('experiences'):
+        sections['experiences'] = layout_section_header('Experience')
+        for exp in content['experiences']:
+            sections['experiences'].extend(layout_experience(exp))
+
+    if content.get('skills'):
+        sections['skills'] = layout_section_header('Skills') + layout_skills(content['skills'])
+        sections['skills'].append(BLANK_PARAGRAPH)
+
+    if content.get('projects'):
+        sections['projects'] = layout_section_header('Projects')
+        for project in content['projects']:
+            sections['projects'].extend(layout_project(project))
+        sections['projects'].append(BLANK_PARAGRAPH)
+
+    if content.get('education'):
+        sections['education'] = layout_section_header('Education')
+        for edu in content['education']:
+            sections['education'].extend(layout_education(edu))
+
+    return sections
+
+
+def estimate_resume_pages(content: Mapping) -> float:
+    """
+    Estimate the page count of the resume generated from content.
+
+    Args:
+        content: Resume content dictionary
+
+    Returns:
+        Estimated page count
+    """
+    sections = layout_resume_sections(content)
+    return estimate_pages(paragraph for section in sections.values() for paragraph in section)
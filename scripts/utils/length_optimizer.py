@@ -5,14 +5,126 @@ Provides functions to reduce resume content to target page lengths
 while preserving important keywords and achievements.
 """
 
-from typing import Dict, List, Any, Tuple
+import heapq
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple, Union
+
+from .keyword_matcher import (
+    KeywordLocation, calculate_keyword_coverage, compile_keyword_matcher, iter_content_segments
+)
+from .keyword_vocabulary import VOCABULARY, count_shared_keywords, keyword_mask, known_keyword_mask
+from .layout_estimator import (
+    PAGE_TEXT_HEIGHT, bullet_paragraph, estimate_resume_pages, layout_experience,
+    layout_height, layout_resume_sections, paragraph_text_height
+)
+from .tokenizer import normalize_text
+
+
+def _item_keyword_mask(item: Dict[str, Any]) -> int:
+    """Keyword bitmask of an experience or bullet, interning it if missing."""
+    mask = item.get('keyword_mask')
+    if mask is None:
+        mask = keyword_mask(item.get('keywords', []))
+    return mask
+
+
+def _sole_carrier_bullets(
+    content: Dict[str, Any],
+    coverage: Dict[str, Any],
+    keywords: List[str]
+) -> Set[int]:
+    """
+    Ids of bullets that are the only place one of the keywords occurs.
+
+    Bullet locations in the coverage map are resolved against the content
+    as it was scored, so call this before any bullets are reordered.
+    """
+    sole_locations = set()
+    keyword_locations = coverage.get('keyword_locations', {})
+    for keyword in keywords:
+        locations = keyword_locations.get(keyword, [])
+        if len(locations) == 1 and locations[0].section == 'bullet':
+            sole_locations.add(locations[0])
+
+    protected = set()
+    for position, exp in enumerate(content.get('experiences', [])):
+        key = exp.get('slug') or str(position)
+        for index, bullet in enumerate(exp.get('bullets', [])):
+            if KeywordLocation('bullet', key, index) in sole_locations:
+                protected.add(id(bullet))
+    return protected
+
+
+# Fewest bullets an experience is reduced to
+MIN_BULLETS_PER_EXPERIENCE = 2
+
+# Value of covering a keyword in budgeted selection, on the score_bullet scale
+REQUIRED_KEYWORD_WEIGHT = 100
+PREFERRED_KEYWORD_WEIGHT = 40
+
+
+def _bullet_height(bullet: Any) -> float:
+    """Height a bullet adds inside a run of bullets, in points."""
+    return paragraph_text_height(bullet_paragraph(bullet))
+
+
+class LengthLedger:
+    """
+    Running laid-out height of resume content, by section.
+
+    Section heights come from the font-metric layout estimator once; each
+    edit during optimization is then applied as a signed delta, so the page
+    estimate is O(1) to read.
+    """
+
+    def __init__(self, content: Dict[str, Any]):
+        self.heights: Dict[str, float] = {
+            section: layout_height(paragraphs)
+            for section, paragraphs in layout_resume_sections(content).items()
+        }
+        self.total_height = sum(self.heights.values())
+
+    @property
+    def pages(self) -> float:
+        """Estimated page count for the current totals."""
+        return self.total_height / PAGE_TEXT_HEIGHT
+
+    def apply(self, section: str, height: float) -> None:
+        """
+        Apply a signed change to a section's height.
+
+        Args:
+            section: Section name, e.g. 'experiences'
+            height: Points added (negative when removed)
+        """
+        self.heights[section] += height
+        self.total_height += height
+
+    def add_bullet(self, bullet: Dict[str, Any]) -> None:
+        """Account for a bullet added to an experience."""
+        self.apply('experiences', _bullet_height(bullet))
+
+    def drop_bullet(self, bullet: Dict[str, Any]) -> None:
+        """Account for a bullet removed from an experience that keeps others."""
+        self.apply('experiences', -_bullet_height(bullet))
+
+    def replace_bullet_text(self, old_text: str, new_text: str) -> None:
+        """Account for a bullet whose text was condensed or swapped."""
+        self.apply('experiences', _bullet_height(new_text) - _bullet_height(old_text))
+
+    def drop_experience(self, exp: Dict[str, Any]) -> None:
+        """Account for a whole experience removed, with its bullets."""
+        self.apply('experiences', -layout_height(layout_experience(exp)))
 
 
 def estimate_content_length(content: Dict[str, Any]) -> float:
     """
     Estimate the number of pages for resume content.
 
-    Uses heuristics based on character count and structure.
+    Lays the content out as the generated DOCX would be, with font
+    metrics and line wrapping (see ``layout_estimator``).
 
     Args:
         content: Dictionary with resume sections
@@ -20,126 +132,214 @@ def estimate_content_length(content: Dict[str, Any]) -> float:
     Returns:
         Estimated page count
     """
-    total_chars = 0
-    total_items = 0
-
-    # Count characters in summary
-    if content.get('summary'):
-        total_chars += len(content['summary'])
+    return estimate_resume_pages(content)
 
-    # Count experience bullets
-    for exp in content.get('experiences', []):
-        total_chars += len(exp.get('company', '')) + len(exp.get('position', ''))
-        total_chars += len(exp.get('summary', ''))
 
-        for bullet in exp.get('bullets', []):
-            total_chars += len(bullet.get('text', ''))
-            total_items += 1
+# Recency points by how many years ago an experience ended, newest bucket first
+RECENCY_BUCKETS = ((2, 15), (5, 10))
 
-    # Count skills
-    for skill_cat in content.get('skills', []):
-        total_chars += len(skill_cat.get('category', ''))
-        total_chars += sum(len(k) for k in skill_cat.get('keywords', []))
+# Points for an experience that has not ended
+CURRENT_ROLE_POINTS = 20
 
-    # Count education
-    for edu in content.get('education', []):
-        total_chars += len(edu.get('institution', '')) + len(edu.get('studyType', ''))
+# Bullet scores remembered per job keyword set and bullet content
+BULLET_SCORE_CACHE_SIZE = 8192
 
-    # Count projects
-    for proj in content.get('projects', []):
-        total_chars += len(proj.get('name', '')) + len(proj.get('description', ''))
 
-    # Rough heuristic:
-    # - ~3000 characters per page
-    # - Each structural item (bullet, section) adds ~25 chars equivalent
-    char_estimate = total_chars / 3000
-    item_estimate = total_items / 40
+class JobScoringContext:
+    """
+    Scoring state for one job, built once per tailoring run.
 
-    return max(char_estimate, item_estimate)
+    Holds the job keywords' bitmask and normalized forms, a compiled matcher
+    for the keywords as written, and a frozen "now" with the recency
+    buckets resolved to end years, so scoring a bullet or experience does no
+    per-call setup.
 
+    Job keywords are looked up in the shared vocabulary, never interned, so
+    scoring many jobs does not grow it; the mask is rebuilt only if the
+    library interns new keywords after the context is created.
+    """
 
-def score_experience(exp: Dict[str, Any], keywords: List[str], recency_weight: float = 0.3) -> float:
+    def __init__(self, keywords: Iterable[str], now: Optional[datetime] = None):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.normalized_keywords = tuple(normalize_text(k) for k in self.keywords)
+        self._keyword_mask = 0
+        self._mask_vocabulary_size = -1
+        self.keyword_set = frozenset(self.normalized_keywords)
+        self.matcher = compile_keyword_matcher(self.keywords, expand_variations=False)
+        self.now = now or datetime.now()
+
+        # Bucket points keyed by the earliest end year that still earns them
+        self.recency_years = tuple(
+            (self.now.year - years_ago, points) for years_ago, points in RECENCY_BUCKETS
+        )
+        self._recency_points: Dict[Any, float] = {}
+
+    @property
+    def keyword_mask(self) -> int:
+        """Bitmask of the job keywords the shared vocabulary knows."""
+        if self._mask_vocabulary_size != len(VOCABULARY):
+            self._keyword_mask = known_keyword_mask(self.keywords)
+            self._mask_vocabulary_size = len(VOCABULARY)
+        return self._keyword_mask
+
+    def count_text_keywords(self, text: str) -> int:
+        """
+        Count the job keywords that occur in text, one scan for all of them.
+
+        A keyword listed more than once counts once per listing.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Number of keyword listings found
+        """
+        matcher = self.matcher
+        found = matcher.find_keyword_ids(text)
+        if len(matcher.keywords) == len(self.keywords):
+            return len(found)
+        return sum(self.keywords.count(matcher.keywords[kw_id]) for kw_id in found)
+
+    def recency_points(self, end_date: Any) -> float:
+        """
+        Recency points for an experience end date, before weighting.
+
+        Args:
+            end_date: "present", a date string starting with the year, or empty
+
+        Returns:
+            Points from CURRENT_ROLE_POINTS or RECENCY_BUCKETS (0 if older or unparseable)
+        """
+        points = self._recency_points.get(end_date)
+        if points is None:
+            points = 0
+            end_text = str(end_date or '')
+            if end_text.lower() == 'present':
+                points = CURRENT_ROLE_POINTS
+            elif end_text:
+                try:
+                    end_year = int(end_text[:4])
+                except ValueError:
+                    end_year = None
+                if end_year is not None:
+                    for first_year, bucket_points in self.recency_years:
+                        if end_year >= first_year:
+                            points = bucket_points
+                            break
+            self._recency_points[end_date] = points
+        return points
+
+
+def _scoring_context(keywords: Union[List[str], JobScoringContext]) -> JobScoringContext:
+    """The given context, or a new one for a plain keyword list."""
+    if isinstance(keywords, JobScoringContext):
+        return keywords
+    return JobScoringContext(keywords)
+
+
+def score_experience(
+    exp: Dict[str, Any],
+    keywords: Union[List[str], JobScoringContext],
+    recency_weight: float = 0.3
+) -> float:
     """
     Score an experience based on keyword relevance and recency.
 
     Args:
         exp: Experience dictionary
-        keywords: List of important keywords
+        keywords: List of important keywords, or a JobScoringContext for them
         recency_weight: Weight for recency (0-1, default 0.3)
 
     Returns:
         Score value (higher is better)
     """
+    context = _scoring_context(keywords)
     score = 0.0
 
     # Base priority from metadata
     priority = exp.get('priority', 5)
     score += (6 - priority) * 10  # Invert priority (1 = highest)
 
-    # Keyword matching
-    exp_keywords = [k.lower() for k in exp.get('keywords', [])]
-    job_keywords_lower = [k.lower() for k in keywords]
-
-    keyword_matches = sum(1 for k in exp_keywords if k in job_keywords_lower)
+    # Keyword matching (bitmask AND + popcount)
+    keyword_matches = count_shared_keywords(_item_keyword_mask(exp), context.keyword_mask)
     score += keyword_matches * 15  # 15 points per keyword match
 
     # Recency bonus (if endDate is recent or "present")
-    if exp.get('endDate', '').lower() == 'present':
-        score += 20 * recency_weight
-    elif exp.get('endDate'):
-        try:
-            # Simple year-based recency
-            end_year = int(exp['endDate'][:4])
-            from datetime import datetime
-            current_year = datetime.now().year
-            years_ago = current_year - end_year
-
-            if years_ago <= 2:
-                score += 15 * recency_weight
-            elif years_ago <= 5:
-                score += 10 * recency_weight
-        except:
-            pass
+    score += context.recency_points(exp.get('endDate', '')) * recency_weight
 
     return score
 
 
-def score_bullet(bullet: Dict[str, Any], keywords: List[str]) -> float:
-    """
-    Score a bullet point based on keyword relevance and priority.
+@lru_cache(maxsize=256)
+def _keyword_scoring_context(keywords: Tuple[str, ...]) -> JobScoringContext:
+    """Shared context for scoring bullets against a plain keyword list."""
+    return JobScoringContext(keywords)
 
-    Args:
-        bullet: Bullet dictionary with text, priority, keywords
-        keywords: List of important keywords from job description
 
-    Returns:
-        Score value (higher is better)
-    """
+# Bullet scores by (job keywords, text, priority, keyword mask), shared by
+# every context for the same keywords; least recently used first
+_bullet_scores: 'OrderedDict[Tuple[Tuple[str, ...], str, int, int], float]' = OrderedDict()
+
+
+def _score_bullet_content(context: JobScoringContext, text: str, priority: int, mask: int) -> float:
+    """Score of a bullet's content with a job's context (see score_bullet)."""
+    key = (context.keywords, text, priority, mask)
+    score = _bullet_scores.get(key)
+    if score is not None:
+        _bullet_scores.move_to_end(key)
+        return score
+
     score = 0.0
 
     # Base priority from metadata
-    priority = bullet.get('priority', 5)
     score += (6 - priority) * 10
 
-    # Keyword matching
-    bullet_keywords = [k.lower() for k in bullet.get('keywords', [])]
-    job_keywords_lower = [k.lower() for k in keywords]
-
-    keyword_matches = sum(1 for k in bullet_keywords if k in job_keywords_lower)
-    score += keyword_matches * 20
+    # Keyword matching (bitmask AND + popcount)
+    score += count_shared_keywords(mask, context.keyword_mask) * 20
 
     # Check if keywords appear in bullet text
-    bullet_text_lower = bullet.get('text', '').lower()
-    text_keyword_matches = sum(1 for k in job_keywords_lower if k in bullet_text_lower)
-    score += text_keyword_matches * 5
+    score += context.count_text_keywords(text) * 5
 
     # Quantification bonus (numbers suggest measurable impact)
-    if any(char.isdigit() for char in bullet.get('text', '')):
+    if any(char.isdigit() for char in text):
         score += 10
 
+    _bullet_scores[key] = score
+    if len(_bullet_scores) > BULLET_SCORE_CACHE_SIZE:
+        _bullet_scores.popitem(last=False)
     return score
 
 
+def score_bullet(bullet: Dict[str, Any], keywords: Union[List[str], JobScoringContext]) -> float:
+    """
+    Score a bullet point based on keyword relevance and priority.
+
+    Scored with the given context's mask and matcher. Scores are memoized
+    by the job's keywords and the bullet's text, priority and keyword mask,
+    so a bullet shared by several experiences or scored again in a later
+    run is computed once; the BULLET_SCORE_CACHE_SIZE most recently used
+    scores are kept.
+
+    Args:
+        bullet: Bullet dictionary with text, priority, keywords
+        keywords: Important keywords from the job description, or a
+            JobScoringContext for them
+
+    Returns:
+        Score value (higher is better)
+    """
+    if isinstance(keywords, JobScoringContext):
+        context = keywords
+    else:
+        context = _keyword_scoring_context(tuple(keywords))
+    return _score_bullet_content(
+        context,
+        bullet.get('text', ''),
+        bullet.get('priority', 5),
+        _item_keyword_mask(bullet)
+    )
+
+
 def select_experience_version(
     exp: Dict[str, Any],
     target_length: str,
@@ -179,7 +379,9 @@ def select_experience_version(
 def reduce_to_target_length(
     content: Dict[str, Any],
     target_pages: float,
-    preserve_keywords: List[str]
+    preserve_keywords: List[str],
+    coverage: Dict[str, Any] = None,
+    context: JobScoringContext = None
 ) -> Tuple[Dict[str, Any], List[str]]:
     """
     Reduce resume content to target page length while preserving keywords.
@@ -190,17 +392,26 @@ def reduce_to_target_length(
     3. Limit number of experiences
     4. Condense lengthy bullet points
 
+    With a coverage map (from ``calculate_keyword_coverage`` over the same
+    content), a bullet that is the only place a preserved keyword occurs is
+    never the one removed.
+
     Args:
         content: Resume content dictionary
         target_pages: Target page count (e.g., 1.0 or 2.0)
         preserve_keywords: Keywords to preserve during reduction
+        coverage: Optional keyword coverage map for the content
+        context: Optional scoring context for preserve_keywords
 
     Returns:
         Tuple of (optimized_content, list_of_changes_made)
     """
+    context = context or JobScoringContext(preserve_keywords)
     optimized = content.copy()
     changes = []
-    current_estimate = estimate_content_length(optimized)
+    ledger = LengthLedger(optimized)
+    current_estimate = ledger.pages
+    protected = _sole_carrier_bullets(optimized, coverage, preserve_keywords) if coverage else set()
 
     # Strategy 1: Use shorter experience versions
     if current_estimate > target_pages * 1.05:
@@ -210,7 +421,7 @@ def reduce_to_target_length(
             if 'detailed' in versions and exp.get('selected_version') == 'detailed':
                 exp['selected_version'] = 'standard'
                 changes.append(f"Shortened {exp.get('company')} from detailed to standard")
-                current_estimate = estimate_content_length(optimized)
+                current_estimate = ledger.pages
 
                 if current_estimate <= target_pages * 1.05:
                     break
@@ -220,20 +431,24 @@ def reduce_to_target_length(
         for exp in optimized.get('experiences', []):
             bullets = exp.get('bullets', [])
 
-            if len(bullets) > 2:  # Keep at least 2 bullets
+            if len(bullets) > MIN_BULLETS_PER_EXPERIENCE:
                 # Score all bullets
                 scored_bullets = [
-                    (bullet, score_bullet(bullet, preserve_keywords))
+                    (bullet, score_bullet(bullet, context))
                     for bullet in bullets
                 ]
                 scored_bullets.sort(key=lambda x: x[1], reverse=True)
 
-                # Keep only top bullets
-                target_bullet_count = max(2, len(bullets) - 1)
-                exp['bullets'] = [b for b, _ in scored_bullets[:target_bullet_count]]
+                # Drop the lowest-scoring bullet that is not a keyword's only carrier
+                removable = [b for b, _ in scored_bullets if id(b) not in protected]
+                if not removable:
+                    continue
+                dropped = removable[-1]
+                exp['bullets'] = [b for b, _ in scored_bullets if b is not dropped]
+                ledger.drop_bullet(dropped)
 
                 changes.append(f"Removed lowest-scoring bullet from {exp.get('company')}")
-                current_estimate = estimate_content_length(optimized)
+                current_estimate = ledger.pages
 
                 if current_estimate <= target_pages * 1.05:
                     break
@@ -246,7 +461,7 @@ def reduce_to_target_length(
             if 'concise' in versions and exp.get('selected_version') == 'standard':
                 exp['selected_version'] = 'concise'
                 changes.append(f"Condensed {exp.get('company')} to concise version")
-                current_estimate = estimate_content_length(optimized)
+                current_estimate = ledger.pages
 
                 if current_estimate <= target_pages * 1.05:
                     break
@@ -258,7 +473,7 @@ def reduce_to_target_length(
         if len(experiences) > 3:
             # Score experiences
             scored_exps = [
-                (exp, score_experience(exp, preserve_keywords))
+                (exp, score_experience(exp, context))
                 for exp in experiences
             ]
             scored_exps.sort(key=lambda x: x[1], reverse=True)
@@ -266,9 +481,11 @@ def reduce_to_target_length(
             # Keep only top experiences
             max_experiences = 4 if target_pages >= 2 else 3
             optimized['experiences'] = [e for e, _ in scored_exps[:max_experiences]]
+            for exp, _ in scored_exps[max_experiences:]:
+                ledger.drop_experience(exp)
 
             changes.append(f"Limited to top {max_experiences} most relevant experiences")
-            current_estimate = estimate_content_length(optimized)
+            current_estimate = ledger.pages
 
     # Strategy 5: Condense bullet points (last resort)
     if current_estimate > target_pages * 1.05:
@@ -276,10 +493,148 @@ def reduce_to_target_length(
             for bullet in exp.get('bullets', []):
                 if len(bullet.get('text', '')) > 150:
                     condensed = condense_bullet_point(bullet['text'], 120, preserve_keywords)
+                    ledger.replace_bullet_text(bullet['text'], condensed)
                     bullet['text'] = condensed
                     changes.append(f"Condensed lengthy bullet in {exp.get('company')}")
 
-        current_estimate = estimate_content_length(optimized)
+        current_estimate = ledger.pages
+
+    return optimized, changes
+
+
+def select_bullets_within_budget(
+    content: Dict[str, Any],
+    target_pages: float,
+    preserve_keywords: List[str],
+    coverage: Dict[str, Any] = None,
+    preferred_keywords: List[str] = None,
+    context: JobScoringContext = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Choose the bullets to keep by budgeted maximum coverage.
+
+    The objective is the weight of the keywords the kept bullets cover
+    (keywords already present outside bullets count as covered) plus each
+    kept bullet's ``score_bullet`` score. Every experience first keeps its
+    MIN_BULLETS_PER_EXPERIENCE best bullets; the rest are added by lazy
+    greedy cost-benefit selection from a priority queue while the page
+    estimate stays within budget. Covering is submodular, so a bullet's
+    queued gain is an upper bound and only the queue head is re-evaluated.
+
+    Args:
+        content: Resume content dictionary
+        target_pages: Target page count (e.g., 1.0 or 2.0)
+        preserve_keywords: Required keywords, weighted REQUIRED_KEYWORD_WEIGHT
+        coverage: Optional keyword coverage map for the content
+        preferred_keywords: Preferred keywords, weighted PREFERRED_KEYWORD_WEIGHT
+        context: Optional scoring context for preserve_keywords
+
+    Returns:
+        Tuple of (optimized_content, list_of_changes_made)
+    """
+    context = context or JobScoringContext(preserve_keywords)
+    preferred_keywords = preferred_keywords or []
+    if coverage is None:
+        coverage = calculate_keyword_coverage(
+            iter_content_segments(content), preserve_keywords, preferred_keywords
+        )
+
+    weights = {kw: PREFERRED_KEYWORD_WEIGHT for kw in preferred_keywords}
+    weights.update((kw, REQUIRED_KEYWORD_WEIGHT) for kw in preserve_keywords)
+
+    # Keywords carried outside bullets stay covered whatever is selected
+    covered = {
+        keyword
+        for keyword, locations in coverage.get('keyword_locations', {}).items()
+        if any(location.section != 'bullet' for location in locations)
+    }
+
+    optimized = content.copy()
+    experiences = optimized.get('experiences', [])
+    ledger = LengthLedger(optimized)
+    budget = target_pages * 1.05
+    location_counts = coverage.get('location_counts', {})
+
+    # Candidates as (experience position, bullet, covered keywords, base score)
+    candidates = []
+    for position, exp in enumerate(experiences):
+        key = exp.get('slug') or str(position)
+        for index, bullet in enumerate(exp.get('bullets', [])):
+            keywords = frozenset(
+                kw for kw in location_counts.get(KeywordLocation('bullet', key, index), ())
+                if kw in weights
+            )
+            score = max(score_bullet(bullet, context), 0.0)
+            candidates.append((position, bullet, keywords, score))
+            ledger.drop_bullet(bullet)
+
+    # Pages taken by everything except bullets, which no selection can reduce
+    fixed_pages = ledger.pages
+
+    def gain(candidate: int) -> float:
+        _, _, keywords, score = candidates[candidate]
+        return score + sum(weights[kw] for kw in keywords if kw not in covered)
+
+    def cost(candidate: int) -> float:
+        return _bullet_height(candidates[candidate][1]) / PAGE_TEXT_HEIGHT
+
+    selected: Set[int] = set()
+
+    def keep(candidate: int) -> None:
+        selected.add(candidate)
+        covered.update(candidates[candidate][2])
+        ledger.add_bullet(candidates[candidate][1])
+
+    # Minimum bullets per experience, picked greedily by marginal gain
+    by_experience: Dict[int, List[int]] = {}
+    for candidate, (position, _, _, _) in enumerate(candidates):
+        by_experience.setdefault(position, []).append(candidate)
+    for members in by_experience.values():
+        for _ in range(min(MIN_BULLETS_PER_EXPERIENCE, len(members))):
+            keep(max((c for c in members if c not in selected), key=gain))
+
+    # Lazy greedy over the rest: (-gain per page, candidate) with stale gains
+    queue = [
+        (-gain(c) / cost(c), c) for c in range(len(candidates)) if c not in selected
+    ]
+    heapq.heapify(queue)
+    while queue:
+        _, candidate = heapq.heappop(queue)
+        ratio = gain(candidate) / cost(candidate)
+        if queue and ratio < -queue[0][0]:
+            heapq.heappush(queue, (-ratio, candidate))
+            continue
+
+        ledger.add_bullet(candidates[candidate][1])
+        fits = ledger.pages <= budget
+        ledger.drop_bullet(candidates[candidate][1])
+        if fits:
+            keep(candidate)
+
+    changes = []
+    for position, members in by_experience.items():
+        exp = experiences[position]
+        kept = [candidates[c][1] for c in members if c in selected]
+        if len(kept) < len(members):
+            exp['bullets'] = kept
+            changes.append(
+                f"Kept {len(kept)} of {len(members)} bullets from {exp.get('company')} (budgeted selection)"
+            )
+
+    for keyword in preserve_keywords:
+        if keyword in coverage.get('keyword_locations', {}) and keyword not in covered:
+            changes.append(f"Required keyword '{keyword}' no longer covered")
+
+    if fixed_pages > budget:
+        changes.append(
+            f"Content outside bullets alone exceeds {target_pages:g} pages "
+            f"(~{fixed_pages:.1f}); no bullet selection can fit the target"
+        )
+    elif ledger.pages > budget:
+        changes.append(
+            f"Minimum of {MIN_BULLETS_PER_EXPERIENCE} bullets per experience exceeds "
+            f"{target_pages:g} pages (~{ledger.pages:.1f})"
+        )
 
     return optimized, changes
 
@@ -323,7 +678,7 @@ def condense_bullet_point(text: str, max_length: int, preserve_keywords: List[st
 
 def prioritize_content(
     experiences: List[Dict[str, Any]],
-    keywords: List[str],
+    keywords: Union[List[str], JobScoringContext],
     max_count: int = None
 ) -> List[Dict[str, Any]]:
     """
@@ -331,15 +686,17 @@ def prioritize_content(
 
     Args:
         experiences: List of experience dictionaries
-        keywords: Important keywords for scoring
+        keywords: Important keywords for scoring, or a JobScoringContext
         max_count: Maximum number of experiences to include (optional)
 
     Returns:
         Filtered and sorted list of experiences
     """
+    context = _scoring_context(keywords)
+
     # Score all experiences
     scored = [
-        (exp, score_experience(exp, keywords))
+        (exp, score_experience(exp, context))
         for exp in experiences
     ]
 
@@ -5,74 +5,176 @@ Parses markdown files with YAML frontmatter to extract structured data.
 """
 
 import os
-import re
-from typing import Dict, List, Any
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import frontmatter
 
+from .file_cache import CacheEntry, ParsedFileCache, parse_file
+from .keyword_vocabulary import keyword_mask
+from .models import Experience, SkillCategory
 
-def parse_experience_file(file_path: str) -> Dict[str, Any]:
-    """
-    Parse an experience markdown file with frontmatter.
 
-    Args:
-        file_path: Path to the experience markdown file
+# Parsed experiences are cached in this file inside the experiences directory
+EXPERIENCE_CACHE_FILENAME = '.experience-cache.pickle'
 
-    Returns:
-        Dictionary with metadata and content
+# Fewer files than this are parsed inline; a process pool would cost more
+PARALLEL_MIN_FILES = 64
+
+
+def _parse_experience_text(text: str, file_path: str) -> Dict[str, Any]:
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        post = frontmatter.load(f)
+    Parse experience markdown into metadata, content, sections and bullets.
+
+    Keyword masks are left out: they index the per-process keyword
+    vocabulary, so they are added after loading rather than cached.
+    """
+    post = frontmatter.loads(text)
 
     data = dict(post.metadata)
     data['content'] = post.content
     data['slug'] = os.path.splitext(os.path.basename(file_path))[0]
 
-    # Parse bullets from content
-    data['bullets'] = parse_bullets_from_markdown(post.content, data.get('versions', {}))
+    # Index sections and parse bullets in one pass over the content
+    data['sections'], data['bullets'] = _scan_markdown(post.content)
 
     return data
 
 
-def parse_bullets_from_markdown(content: str, versions: Dict[str, int]) -> List[Dict[str, Any]]:
-    """
-    Parse bullet points from markdown content with metadata.
+def _build_experience(parsed: Dict[str, Any]) -> Experience:
+    """Build an Experience from a parsed dict, adding keyword masks to it and its bullets."""
+    data = dict(parsed)
+    data['keyword_mask'] = keyword_mask(data.get('keywords', []))
+    data['bullets'] = [
+        dict(bullet, keyword_mask=keyword_mask(bullet['keywords']))
+        for bullet in parsed['bullets']
+    ]
+    return Experience.from_dict(data)
 
-    Extracts bullets with priority and keywords from format:
-    ### 1. Title [priority:1, keywords:Python,AWS]
+
+def parse_experience_file(file_path: str, cache: ParsedFileCache = None) -> Experience:
+    """
+    Parse an experience markdown file with frontmatter.
 
     Args:
-        content: Markdown content
-        versions: Dictionary with version names and bullet counts
+        file_path: Path to the experience markdown file
+        cache: Optional parsed-file cache to read from and update
 
     Returns:
-        List of bullet dictionaries with text, priority, keywords
+        Experience record (a read-only mapping of metadata, content and bullets)
     """
-    bullets = []
+    if cache is not None:
+        return _build_experience(cache.get(file_path, _parse_experience_text))
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    return _build_experience(_parse_experience_text(text, file_path))
+
+
+def _split_bullet_header(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a "### 1. Title [metadata]" line into (title, metadata).
+
+    Returns None if the line is not a numbered bullet header. Metadata runs
+    from the first "[" after the title's first character to the "]" that
+    ends the line.
+    """
+    if line[:3] != '###' or not line[3:4].isspace():
+        return None
+
+    rest = line[3:].lstrip()
+    number = 0
+    while number < len(rest) and rest[number].isdecimal():
+        number += 1
+    if not number or rest[number:number + 1] != '.' or not rest[number + 1:number + 2].isspace():
+        return None
+
+    rest = rest[number + 1:].lstrip()
+    if not rest:
+        return None
+
+    if rest.endswith(']'):
+        bracket = rest.find('[', 1)
+        if 0 < bracket < len(rest) - 2:
+            return rest[:bracket], rest[bracket + 1:-1]
+    return rest, ''
+
+
+def _is_section_break(line: str) -> bool:
+    """Whether a line is a ## or ### heading, which ends a bullet description."""
+    if line[:2] != '##':
+        return False
+    following = line[2:3]
+    if following == '#':
+        following = line[3:4]
+    return not following or following.isspace()
+
+
+def _parse_bullet_priority(metadata: str) -> Optional[int]:
+    """First "priority:<digits>" value in a metadata string."""
+    start = metadata.find('priority:')
+    while start != -1:
+        value_start = end = start + len('priority:')
+        while end < len(metadata) and metadata[end].isdecimal():
+            end += 1
+        if end > value_start:
+            return int(metadata[value_start:end])
+        start = metadata.find('priority:', value_start)
+    return None
+
+
+def _parse_bullet_keywords(metadata: str) -> List[str]:
+    """
+    Comma-separated keywords after the first "keywords:" with a value.
+
+    The list stops at a "]" or an empty item.
+    """
+    start = metadata.find('keywords:')
+    while start != -1:
+        value_start = start + len('keywords:')
+        value = metadata[value_start:].split(']', 1)[0]
+        keywords = []
+        for item in value.split(','):
+            if not item:
+                break
+            keywords.append(item.strip())
+        if keywords:
+            return keywords
+        start = metadata.find('keywords:', value_start)
+    return []
+
 
-    # Pattern to match bullet headers with optional metadata
-    pattern = r'###\s+\d+\.\s+(.+?)(?:\[(.+?)\])?\n((?:.+\n)*?)(?=###|\Z)'
+def _scan_markdown(content: str) -> Tuple[Dict[str, Tuple[str, int, int]], List[Dict[str, Any]]]:
+    """
+    Scan markdown once, line by line, for ## sections and numbered bullets.
 
-    matches = re.finditer(pattern, content, re.MULTILINE)
+    A section's body runs from the line after its "## Title" heading to the
+    next ## heading; sections are keyed by lowercased title (first one
+    wins) and located by (title, start, end) offsets into content. A
+    bullet's description runs (blank lines included) up to the next ##/###
+    heading or the end of the text. Runs in time linear in the content.
+    """
+    sections: Dict[str, Tuple[str, int, int]] = {}
+    section_title = None
+    section_start = 0
+    bullets = []
+    header = None
+    description_lines: List[str] = []
 
-    for i, match in enumerate(matches, 1):
-        title = match.group(1).strip()
-        metadata_str = match.group(2) if match.group(2) else ''
-        description = match.group(3).strip()
+    def finish() -> None:
+        title, metadata_str = header
+        title = title.strip()
+        description = '\n'.join(description_lines).strip()
 
         # Parse metadata
-        priority = i  # Default priority based on order
+        priority = len(bullets) + 1  # Default priority based on order
         keywords = []
 
         if metadata_str:
-            # Extract priority
-            priority_match = re.search(r'priority:(\d+)', metadata_str)
-            if priority_match:
-                priority = int(priority_match.group(1))
-
-            # Extract keywords
-            keywords_match = re.search(r'keywords:([^,\]]+(?:,[^,\]]+)*)', metadata_str)
-            if keywords_match:
-                keywords = [k.strip() for k in keywords_match.group(1).split(',')]
+            explicit_priority = _parse_bullet_priority(metadata_str)
+            if explicit_priority is not None:
+                priority = explicit_priority
+            keywords = _parse_bullet_keywords(metadata_str)
 
         # Full text for bullet point
         full_text = f"{title}. {description}" if description else title
@@ -85,32 +187,167 @@ def parse_bullets_from_markdown(content: str, versions: Dict[str, int]) -> List[
             'keywords': keywords
         })
 
+    offset = 0
+    for line in content.split('\n'):
+        line_start = offset
+        offset += len(line) + 1
+
+        # Only lines starting with ## can be headers or section breaks
+        is_heading = line[:2] == '##'
+        line_header = _split_bullet_header(line) if is_heading else None
+        if line_header is None and not (is_heading and _is_section_break(line)):
+            if header is not None:
+                description_lines.append(line)
+            continue
+
+        if header is not None:
+            finish()
+        header = line_header
+        description_lines = []
+
+        if line[2:3] != '#':
+            if section_title is not None:
+                sections.setdefault(section_title.lower(), (section_title, section_start, line_start))
+            section_title = line[2:].strip()
+            section_start = min(offset, len(content))
+
+    if header is not None:
+        finish()
+    if section_title is not None:
+        sections.setdefault(section_title.lower(), (section_title, section_start, len(content)))
+
+    return sections, bullets
+
+
+def _scan_bullets(content: str) -> List[Dict[str, Any]]:
+    """Numbered bullets of markdown content, without keyword masks."""
+    return _scan_markdown(content)[1]
+
+
+def parse_bullets_from_markdown(content: str, versions: Dict[str, int]) -> List[Dict[str, Any]]:
+    """
+    Parse bullet points from markdown content with metadata.
+
+    Extracts bullets with priority and keywords from format:
+    ### 1. Title [priority:1, keywords:Python,AWS]
+
+    Args:
+        content: Markdown content
+        versions: Dictionary with version names and bullet counts
+
+    Returns:
+        List of bullet dictionaries with text, priority, keywords and
+        keyword_mask (bitmask in the shared keyword vocabulary)
+    """
+    bullets = _scan_bullets(content)
+    for bullet in bullets:
+        bullet['keyword_mask'] = keyword_mask(bullet['keywords'])
     return bullets
 
 
-def load_all_experiences(experiences_dir: str) -> List[Dict[str, Any]]:
+def load_experience_cache(experiences_dir: str) -> ParsedFileCache:
+    """
+    Load the parsed-experience cache kept in an experiences directory.
+
+    Args:
+        experiences_dir: Path to experiences directory
+
+    Returns:
+        ParsedFileCache bound to the directory's cache file
+    """
+    return ParsedFileCache.load(os.path.join(experiences_dir, EXPERIENCE_CACHE_FILENAME))
+
+
+def _parse_experience_entry(file_path: str) -> Tuple[str, Optional[CacheEntry], Optional[str]]:
+    """Worker entry point: parse one file, returning an error message instead of raising."""
+    try:
+        return file_path, parse_file(file_path, _parse_experience_text), None
+    except Exception as e:
+        return file_path, None, str(e)
+
+
+def _parse_experience_files(
+    file_paths: List[str],
+    workers: int = None
+) -> Iterable[Tuple[str, Optional[CacheEntry], Optional[str]]]:
+    """
+    Parse experience files, in a process pool when there are enough of them.
+
+    Results come back in the order of file_paths whatever the worker count.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    if workers <= 1 or len(file_paths) < PARALLEL_MIN_FILES:
+        return map(_parse_experience_entry, file_paths)
+
+    chunksize = max(1, len(file_paths) // (workers * 4))
+    with Pool(processes=workers) as pool:
+        return pool.map(_parse_experience_entry, file_paths, chunksize=chunksize)
+
+
+def load_all_experiences(
+    experiences_dir: str,
+    use_cache: bool = True,
+    workers: int = None
+) -> List[Experience]:
     """
     Load all experience files from a directory.
 
+    Parsed files are cached in the directory (see ``EXPERIENCE_CACHE_FILENAME``),
+    so unchanged files are not re-parsed on the next run. Files that do need
+    parsing are parsed by a process pool once there are at least
+    PARALLEL_MIN_FILES of them. The result order does not depend on the
+    worker count: files are taken in name order, then sorted by priority.
+
     Args:
         experiences_dir: Path to experiences directory
+        use_cache: Read and update the parsed-experience cache
+        workers: Number of worker processes (default: CPU count; 1 parses inline)
 
     Returns:
-        List of experience dictionaries
+        List of Experience records
     """
     experiences = []
 
     if not os.path.exists(experiences_dir):
         return experiences
 
-    for filename in os.listdir(experiences_dir):
-        if filename.endswith('.md'):
-            file_path = os.path.join(experiences_dir, filename)
+    cache = load_experience_cache(experiences_dir) if use_cache else None
+    file_paths = [
+        os.path.join(experiences_dir, filename)
+        for filename in sorted(os.listdir(experiences_dir))
+        if filename.endswith('.md')
+    ]
+
+    parsed = {}
+    to_parse = []
+    for file_path in file_paths:
+        data = None
+        if cache is not None:
             try:
-                exp = parse_experience_file(file_path)
-                experiences.append(exp)
-            except Exception as e:
-                print(f"Warning: Could not parse {filename}: {e}")
+                data = cache.lookup(file_path)
+            except OSError:
+                pass
+        if data is None:
+            to_parse.append(file_path)
+        else:
+            parsed[file_path] = data
+
+    for file_path, entry, error in _parse_experience_files(to_parse, workers):
+        if error is not None:
+            print(f"Warning: Could not parse {os.path.basename(file_path)}: {error}")
+            continue
+        if cache is not None:
+            cache.store(file_path, entry)
+        parsed[file_path] = entry.data
+
+    if cache is not None:
+        cache.save()
+
+    # Keyword masks are process-local, so they are added here, not by workers
+    experiences = [
+        _build_experience(parsed[file_path])
+        for file_path in file_paths if file_path in parsed
+    ]
 
     # Sort by priority (lower number = higher priority)
     experiences.sort(key=lambda x: x.get('priority', 999))
@@ -118,7 +355,7 @@ def load_all_experiences(experiences_dir: str) -> List[Dict[str, Any]]:
     return experiences
 
 
-def load_skills_file(skills_file: str) -> List[Dict[str, Any]]:
+def load_skills_file(skills_file: str) -> List[SkillCategory]:
     """
     Load skills from a markdown file.
 
@@ -126,7 +363,7 @@ def load_skills_file(skills_file: str) -> List[Dict[str, Any]]:
         skills_file: Path to skills markdown file
 
     Returns:
-        List of skill categories
+        List of SkillCategory records
     """
     if not os.path.exists(skills_file):
         return []
@@ -145,10 +382,10 @@ def load_skills_file(skills_file: str) -> List[Dict[str, Any]]:
         # Section headers become categories
         if line.startswith('##'):
             if current_category and current_keywords:
-                skills.append({
+                skills.append(SkillCategory.from_dict({
                     'category': current_category,
                     'keywords': current_keywords
-                })
+                }))
 
             current_category = line.lstrip('#').strip()
             current_keywords = []
@@ -161,10 +398,10 @@ def load_skills_file(skills_file: str) -> List[Dict[str, Any]]:
 
     # Add last category
     if current_category and current_keywords:
-        skills.append({
+        skills.append(SkillCategory.from_dict({
             'category': current_category,
             'keywords': current_keywords
-        })
+        }))
 
     return skills
 
@@ -0,0 +1,213 @@
+"""
+Compact, immutable records for loaded resume data.
+
+Experiences, bullets and skill categories are slotted classes instead of
+dicts: no per-instance ``__dict__``, keyword strings interned and stored as
+tuples, and a bullet's ``text`` derived from its title and description
+rather than stored a third time. Each record is a read-only Mapping, so
+code written against the old dicts (``exp['bullets']``, ``exp.get('slug')``,
+``dict(bullet)``) keeps working.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Tuple
+
+
+def intern_keywords(keywords: Iterable[Any]) -> Tuple[str, ...]:
+    """Intern keyword strings so every record shares one copy of each."""
+    return tuple(sys.intern(str(keyword)) for keyword in keywords or ())
+
+
+class Section(NamedTuple):
+    """A ## section of experience markdown, as offsets into its content."""
+    title: str
+    start: int  # first character of the body, after the heading line
+    end: int  # start of the next ## heading, or the end of the content
+
+
+class Record(Mapping):
+    """
+    Read-only mapping over a fixed set of slots.
+
+    A slot that was never assigned is an absent key, so ``get`` falls back
+    to its default exactly as it did for a dict without that key.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, **values: Any):
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _extra(self) -> Dict[str, Any]:
+        return {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self._extra()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key
+        yield from self._extra()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, '__slots__', ())
+            if hasattr(self, slot)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, mutable dict copy of the record."""
+        return dict(self)
+
+
+class Bullet(Record):
+    """An achievement bullet; ``text`` is "Title. Description"."""
+
+    __slots__ = ('title', 'description', 'priority', 'keywords', 'keyword_mask')
+    _fields = ('title', 'description', 'text', 'priority', 'keywords', 'keyword_mask')
+
+    @property
+    def text(self) -> str:
+        return f"{self.title}. {self.description}" if self.description else self.title
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Bullet':
+        """
+        Build a bullet from a parsed bullet dict (its 'text' is ignored).
+
+        Args:
+            data: Dictionary with title, description, priority, keywords
+                and keyword_mask
+
+        Returns:
+            Bullet
+        """
+        values = {key: data[key] for key in cls.__slots__ if key in data}
+        if 'keywords' in values:
+            values['keywords'] = intern_keywords(values['keywords'])
+        return cls(**values)
+
+
+class SkillCategory(Record):
+    """A named group of skills."""
+
+    __slots__ = ('category', 'keywords')
+    _fields = __slots__
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SkillCategory':
+        """
+        Build a skill category from a dict with 'category' and 'keywords'.
+
+        Args:
+            data: Skill category dictionary
+
+        Returns:
+            SkillCategory
+        """
+        return cls(
+            category=data.get('category', ''),
+            keywords=intern_keywords(data.get('keywords', ()))
+        )
+
+
+class Experience(Record):
+    """
+    A work experience with its sections and bullets.
+
+    Frontmatter keys without a slot of their own are kept in a small
+    read-only extras dict and are still reachable by key. ``sections``
+    maps each lowercased ## heading to a Section located in ``content``.
+    """
+
+    __slots__ = (
+        'slug', 'company', 'position', 'location', 'startDate', 'endDate',
+        'keywords', 'relevant_for', 'priority', 'versions', 'content',
+        'sections', 'bullets', 'keyword_mask', 'extras'
+    )
+    _fields = __slots__[:-1]
+
+    def _extra(self) -> Dict[str, Any]:
+        return getattr(self, 'extras', None) or {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Experience':
+        """
+        Build an experience from a parsed experience dict.
+
+        Args:
+            data: Frontmatter metadata plus content, slug, sections,
+                bullets and keyword_mask
+
+        Returns:
+            Experience with Bullet records
+        """
+        values = {}
+        extras = {}
+        for key, value in data.items():
+            if key in cls._fields:
+                values[key] = value
+            else:
+                extras[key] = value
+
+        for key in ('keywords', 'relevant_for'):
+            if isinstance(values.get(key), (list, tuple)):
+                values[key] = intern_keywords(values[key])
+        if 'sections' in values:
+            values['sections'] = {key: Section(*section) for key, section in values['sections'].items()}
+        if 'bullets' in values:
+            values['bullets'] = tuple(Bullet.from_dict(bullet) for bullet in values['bullets'])
+        if extras:
+            values['extras'] = extras
+
+        return cls(**values)
+
+    def section(self, key: str, default: str = '') -> str:
+        """
+        Body text of a section, read by its offsets.
+
+        Args:
+            key: Lowercased section title, e.g. 'summary' or 'achievements'
+            default: Returned when the experience has no such section
+
+        Returns:
+            Stripped section text
+        """
+        section = self.get('sections', {}).get(key)
+        if section is None:
+            return default
+        return self.content[section.start:section.end].strip()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, mutable dict copy, with bullets as dicts too."""
+        data = dict(self)
+        if 'bullets' in data:
+            data['bullets'] = [bullet.to_dict() for bullet in data['bullets']]
+        return data
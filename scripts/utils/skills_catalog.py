@@ -0,0 +1,130 @@
+"""
+Indexed skills catalog.
+
+Holds skill categories together with a normalized keyword -> category
+index, so a job keyword is mapped to the categories that list it (or a
+variation of it) with one dict lookup, and categories can be ordered by
+job relevance in a single pass over the job's keywords.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .keyword_matcher import normalize_keyword
+from .models import SkillCategory
+from .tokenizer import normalize_text
+
+
+# A highlighted keyword counts this many times a plain job keyword
+HIGHLIGHT_WEIGHT = 2
+
+
+def _index_key(keyword: str) -> str:
+    return normalize_text(str(keyword)).strip()
+
+
+class SkillsCatalog:
+    """
+    Skill categories with a keyword -> (category, keyword) position index.
+
+    Each skill is indexed under every variation ``normalize_keyword``
+    produces for it, so "Amazon Web Services" finds the category listing
+    "AWS" and "APIs" finds "API".
+    """
+
+    def __init__(self, categories: Iterable[Mapping[str, Any]]):
+        self.categories: Tuple[SkillCategory, ...] = tuple(
+            cat if isinstance(cat, SkillCategory) else SkillCategory.from_dict(cat)
+            for cat in categories
+        )
+        self.category_positions: Dict[str, int] = {}
+        self.keyword_index: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+
+        index: Dict[str, Dict[Tuple[int, int], None]] = {}
+        for cat_pos, cat in enumerate(self.categories):
+            self.category_positions.setdefault(_index_key(cat.category), cat_pos)
+            for kw_pos, skill in enumerate(cat.keywords):
+                for variation in normalize_keyword(skill):
+                    key = _index_key(variation)
+                    if key:
+                        index.setdefault(key, {})[(cat_pos, kw_pos)] = None
+
+        self.keyword_index = {key: tuple(positions) for key, positions in index.items()}
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def categories_for(self, keyword: str) -> List[SkillCategory]:
+        """
+        Categories that list a keyword or one of its variations.
+
+        Args:
+            keyword: Job keyword in any case
+
+        Returns:
+            Matching categories in catalog order
+        """
+        positions = dict.fromkeys(cat_pos for cat_pos, _ in self.keyword_index.get(_index_key(keyword), ()))
+        return [self.categories[cat_pos] for cat_pos in positions]
+
+    def prioritize(
+        self,
+        priority_categories: Iterable[str] = (),
+        highlight_keywords: Iterable[str] = (),
+        job_keywords: Iterable[str] = (),
+        max_categories: Optional[int] = None
+    ) -> List[SkillCategory]:
+        """
+        Order categories, and the skills within them, by job relevance.
+
+        Priority categories come first in catalog order. The rest follow by
+        relevance: highlighted keywords they list count HIGHLIGHT_WEIGHT,
+        other job keywords count 1, and ties keep catalog order. Within a
+        category, highlighted skills come first, then other skills the job
+        mentions, then the rest.
+
+        Args:
+            priority_categories: Category names to put first (any case)
+            highlight_keywords: Keywords to emphasize
+            job_keywords: Required and preferred job keywords
+            max_categories: Keep at most this many categories
+
+        Returns:
+            List of SkillCategory records
+        """
+        relevance = [0] * len(self.categories)
+        emphasis: Dict[Tuple[int, int], int] = {}
+
+        weighted = [(kw, HIGHLIGHT_WEIGHT) for kw in highlight_keywords]
+        weighted.extend((kw, 1) for kw in job_keywords)
+        for keyword, weight in weighted:
+            for cat_pos, kw_pos in self.keyword_index.get(_index_key(keyword), ()):
+                relevance[cat_pos] += weight
+                emphasis[(cat_pos, kw_pos)] = max(emphasis.get((cat_pos, kw_pos), 0), weight)
+
+        first = {
+            self.category_positions[key]
+            for key in map(_index_key, priority_categories)
+            if key in self.category_positions
+        }
+        order = sorted(
+            range(len(self.categories)),
+            key=lambda pos: (pos not in first, 0 if pos in first else -relevance[pos])
+        )
+        if max_categories is not None:
+            order = order[:max_categories]
+
+        prioritized = []
+        for cat_pos in order:
+            cat = self.categories[cat_pos]
+            if any((cat_pos, kw_pos) in emphasis for kw_pos in range(len(cat.keywords))):
+                ranked = sorted(
+                    range(len(cat.keywords)),
+                    key=lambda kw_pos: -emphasis.get((cat_pos, kw_pos), 0)
+                )
+                cat = SkillCategory(
+                    category=cat.category,
+                    keywords=tuple(cat.keywords[kw_pos] for kw_pos in ranked)
+                )
+            prioritized.append(cat)
+
+        return prioritized
@@ -0,0 +1,169 @@
+"""
+Shared text normalization and tokenization.
+
+Every module that needs words out of resume or job text goes through here,
+so text is normalized the same way everywhere and each distinct text is
+tokenized once per process, however many scorers look at it.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# Tokens keep internal separators so "ci/cd", "node.js" and "c++" stay whole
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:[\-/.][a-z0-9+#]+)*')
+
+# Separators inside a token ("multi-account", "ci/cd", "node.js")
+TOKEN_SEPARATOR_PATTERN = re.compile(r'[\-/.]')
+
+# Longer texts (e.g. streamed corpus chunks) are processed but not memoized
+CACHE_MAX_CHARS = 1 << 14
+
+# Typographic punctuation that NFKD leaves alone
+_TYPOGRAPHIC = str.maketrans({
+    '\u2010': '-', '\u2011': '-', '\u2012': '-', '\u2013': '-', '\u2014': '-', '\u2015': '-',
+    '\u2212': '-',
+    '\u2018': "'", '\u2019': "'", '\u201a': "'", '\u201b': "'",
+    '\u201c': '"', '\u201d': '"', '\u201e': '"', '\u201f': '"',
+})
+
+
+class Token(NamedTuple):
+    """A normalized token and its span in the original text."""
+    text: str
+    start: int
+    end: int
+
+
+def _normalize_char(char: str) -> str:
+    """Compatibility-decompose a character, drop diacritics and lowercase it."""
+    decomposed = unicodedata.normalize('NFKD', char)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.translate(_TYPOGRAPHIC).lower()
+
+
+def _normalize(text: str) -> Tuple[str, Optional[Tuple[int, ...]]]:
+    """
+    Normalize text, keeping a map back to original offsets.
+
+    Returns:
+        Tuple of (normalized text, offsets) where offsets[i] is the original
+        index of normalized character i (plus a final end offset), or None
+        when every character maps to itself
+    """
+    if text.isascii():
+        return text.lower(), None
+
+    pieces: List[str] = []
+    offsets: List[int] = []
+    for i, char in enumerate(text):
+        normalized = _normalize_char(char)
+        pieces.append(normalized)
+        offsets.extend([i] * len(normalized))
+    offsets.append(len(text))
+
+    normalized_text = ''.join(pieces)
+    if len(normalized_text) == len(text) and all(len(piece) == 1 for piece in pieces):
+        return normalized_text, None
+    return normalized_text, tuple(offsets)
+
+
+_normalize_cached = lru_cache(maxsize=8192)(_normalize)
+
+
+def _normalize_with_offsets(text: str) -> Tuple[str, Optional[Tuple[int, ...]]]:
+    """Memoized _normalize for texts short enough to cache."""
+    if len(text) > CACHE_MAX_CHARS:
+        return _normalize(text)
+    return _normalize_cached(text)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for matching.
+
+    Applies Unicode compatibility decomposition (ligatures, full-width
+    forms, non-breaking spaces), strips diacritics, folds typographic
+    dashes and quotes to ASCII and lowercases. Results are memoized.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    return _normalize_with_offsets(text)[0]
+
+
+def iter_tokens(text: str) -> Iterator[Token]:
+    """
+    Yield the tokens of a text without memoizing the token list.
+
+    Args:
+        text: Text to tokenize
+
+    Yields:
+        Tokens with spans into the original (un-normalized) text
+    """
+    normalized, offsets = _normalize_with_offsets(text)
+
+    for match in TOKEN_PATTERN.finditer(normalized):
+        start, end = match.span()
+        if offsets is not None:
+            start, end = offsets[start], offsets[end - 1] + 1
+        yield Token(match.group(0), start, end)
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_cached(text: str) -> Tuple[Token, ...]:
+    return tuple(iter_tokens(text))
+
+
+def tokenize(text: str) -> Tuple[Token, ...]:
+    """
+    Split text into normalized tokens with character spans.
+
+    Memoized per text, so a summary or bullet scored by several modules is
+    tokenized once per process. Texts over CACHE_MAX_CHARS are tokenized
+    without being cached.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Tuple of Token(text, start, end), offsets into the original text
+    """
+    if len(text) > CACHE_MAX_CHARS:
+        return tuple(iter_tokens(text))
+    return _tokenize_cached(text)
+
+
+@lru_cache(maxsize=8192)
+def token_set(text: str) -> FrozenSet[str]:
+    """
+    Distinct tokens of a text plus the parts of compound tokens.
+
+    "multi-account ci/cd" gives {"multi-account", "multi", "account",
+    "ci/cd", "ci", "cd"}, so membership tests behave like word-boundary
+    searches.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Frozen set of tokens and token parts
+    """
+    words = set()
+    for token in tokenize(text):
+        words.add(token.text)
+        words.update(part for part in TOKEN_SEPARATOR_PATTERN.split(token.text) if part)
+    return frozenset(words)
+
+
+def clear_caches() -> None:
+    """Drop all memoized normalizations and tokenizations."""
+    _normalize_cached.cache_clear()
+    _tokenize_cached.cache_clear()
+    token_set.cache_clear()